@@ -6,19 +6,24 @@ A pure Python agent that continuously monitors JSON files containing video summa
 and maintains an overall consolidated AI summary using Ollama.
 The AI autonomously analyzes content complexity and determines
 the optimal detail level without any user input or prompts.
-Runs continuously, checking for new files at regular intervals.
+Runs continuously, reacting to filesystem events as new files appear.
 """
 
+import asyncio
 import json
 import os
+import re
 import sys
 import time
 import hashlib
 import signal
+import sqlite3
 import threading
+import unicodedata
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 from pydantic import BaseModel, Field
 from rich.console import Console
 from rich.panel import Panel
@@ -26,11 +31,73 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 from dotenv import load_dotenv
 
+try:
+    import httpx  # Optional: enables concurrent chunked summarization
+except ImportError:
+    httpx = None
+
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+from watchfiles import watch, Change
+
 # Load environment variables
 load_dotenv()
 
 console = Console()
 
+# Read size used when hashing monitored files
+HASH_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+# Version stamped into summary_metadata of files this agent writes; files carrying it
+# are trusted and loaded without re-running Pydantic validation
+SUMMARY_SCHEMA_VERSION = 1
+
+def _is_trusted(data: Dict[str, Any]) -> bool:
+    """Check whether a JSON document was written by this agent's current schema"""
+    metadata = data.get("summary_metadata")
+    return isinstance(metadata, dict) and metadata.get("schema_version") == SUMMARY_SCHEMA_VERSION
+
+# Batches larger than this are summarized as concurrent chunks when httpx is available
+CHUNK_THRESHOLD = 20
+CHUNK_SIZE = 10
+
+# Matches a detail level as a whole word, so e.g. "BRIEFLY" is not taken as BRIEF
+_DETAIL_RE = re.compile(r"\b(BRIEF|STANDARD|DETAILED|EXTENSIVE)\b", re.IGNORECASE)
+
+# Per-video excerpt length used when sampling content for complexity analysis
+SAMPLE_CHARS = 800
+ELLIPSIS = "..."
+
+# Maximum characters of each video summary included in a generation prompt
+PER_VIDEO_CAP = {
+    "BRIEF": 300,
+    "STANDARD": 600,
+    "DETAILED": 1200,
+    "EXTENSIVE": 2000
+}
+
+# Generation budget for each detail level
+MAX_TOKENS_BY_DETAIL = {
+    "BRIEF": 800,
+    "STANDARD": 1500,
+    "DETAILED": 2500,
+    "EXTENSIVE": 4000
+}
+
 class VideoSummary(BaseModel):
     """Model for individual video summary data"""
     video_id: Optional[str] = None
@@ -47,33 +114,121 @@ class OverallSummary(BaseModel):
     overall_ai_description: str = Field(description="AI-generated overall description")
     processed_files: List[str] = Field(description="List of processed file paths")
     file_hashes: Dict[str, str] = Field(description="File hashes to avoid reprocessing")
+    hash_cache: Dict[str, str] = Field(default_factory=dict, description="Content hashes keyed by file stat signature")
+    video_summaries: List[str] = Field(default_factory=list, description="Per-video summaries extracted from processed files")
+    video_sources: Dict[str, str] = Field(default_factory=dict, description="Results file each summarized video came from, keyed by video ID")
     summary_metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
+class ResponseCache:
+    """SQLite-backed cache of Ollama responses keyed on a hash of the request"""
+    
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key BLOB PRIMARY KEY, model TEXT, response TEXT, ts INTEGER)"
+            )
+            self._conn.commit()
+    
+    @staticmethod
+    def make_key(model: str, prompt: str, options: Dict[str, Any]) -> bytes:
+        """Hash the request, normalizing the prompt so cosmetic differences still hit"""
+        lines = [line.rstrip() for line in prompt.strip().splitlines()]
+        normalized = unicodedata.normalize("NFC", "\n".join(lines))
+        request = json.dumps({"m": model, "p": normalized, "o": options}, sort_keys=True)
+        return hashlib.sha256(request.encode("utf-8")).digest()
+    
+    def get(self, key: bytes) -> Optional[str]:
+        """Return the cached response for a key, if any"""
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: bytes, model: str, response: str):
+        """Store a response for a key"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, ts) VALUES (?, ?, ?, ?)",
+                (key, model, response, int(time.time()))
+            )
+            self._conn.commit()
+
 class OllamaClient:
     """Client for interacting with Ollama API"""
     
-    def __init__(self, base_url: str = "http://localhost:11434"):
+    def __init__(self, base_url: str = "http://localhost:11434", cache_path: Optional[str] = None):
         self.base_url = base_url
         self.api_url = f"{base_url}/api/generate"
+        self.cache = ResponseCache(cache_path) if cache_path else None
+        
+        # Reuse one keep-alive connection pool for every request to Ollama
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Connection"] = "keep-alive"
     
     def is_available(self) -> bool:
         """Check if Ollama is running and available"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
     
+    def _cache_lookup(self, payload: Dict[str, Any]):
+        """Return the cache key for a payload and the cached response, if any"""
+        if not self.cache:
+            return None, None
+        key = ResponseCache.make_key(payload["model"], payload["prompt"], payload.get("options", {}))
+        cached = self.cache.get(key)
+        if cached is not None:
+            console.print("[green]⚡ Using cached Ollama response[/green]")
+        return key, cached
+    
+    def _generation_payload(self, prompt: str, detail_level: str, model: str) -> Dict[str, Any]:
+        """Build a summary generation request sized for the detail level"""
+        return {
+            "model": model,
+            "prompt": prompt,
+            "stream": False,
+            "options": {
+                "temperature": 0.7,
+                "top_p": 0.9,
+                # Adjust max_tokens based on detail level
+                "max_tokens": MAX_TOKENS_BY_DETAIL.get(detail_level, 1500)
+            }
+        }
+    
+    def _generate(self, payload: Dict[str, Any], timeout: int) -> str:
+        """Send a generate request, serving repeated requests from the response cache"""
+        key, cached = self._cache_lookup(payload)
+        if cached is not None:
+            return cached
+        
+        response = self.session.post(self.api_url, json=payload, timeout=timeout)
+        response.raise_for_status()
+        
+        result = response.json()
+        text = result.get("response", "")
+        if key is not None and text:
+            self.cache.set(key, payload["model"], text)
+        return text
+    
     def analyze_content_complexity(self, video_summaries: List[str], model: str = "deepseek-r1:8b") -> str:
         """Autonomously analyze content complexity and determine optimal detail level using Ollama"""
         
         console.print(f"[blue]🤖 Ollama analyzing content complexity for {len(video_summaries)} videos...[/blue]")
         
         # Create a comprehensive sample for analysis
-        content_sample = "\n\n".join([
-            f"Video {i+1}:\n{summary[:800] + '...' if len(summary) > 800 else summary}" 
-            for i, summary in enumerate(video_summaries[:min(3, len(video_summaries))])
-        ])
+        parts = []
+        append = parts.append
+        for i, summary in enumerate(video_summaries[:3]):
+            append(f"Video {i+1}:\n{summary[:SAMPLE_CHARS]}{ELLIPSIS if len(summary) > SAMPLE_CHARS else ''}")
+        content_sample = "\n\n".join(parts)
         
         analysis_prompt = f"""You are an AI content analyst. Analyze these video summaries and determine the optimal detail level for generating a consolidated summary.
 
@@ -111,18 +266,14 @@ Based on your gentle analysis of the content complexity, technical depth, and ed
         }
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=120)
-            response.raise_for_status()
-            
-            result = response.json()
-            detail_response = result.get("response", "STANDARD")
+            detail_response = self._generate(payload, timeout=120) or "STANDARD"
             
             # Extract detail level from response
-            detail_levels = ["BRIEF", "STANDARD", "DETAILED", "EXTENSIVE"]
-            for level in detail_levels:
-                if level in detail_response.upper():
-                    console.print(f"[green]✅ Ollama analysis complete: {level} detail level selected[/green]")
-                    return level
+            match = _DETAIL_RE.search(detail_response)
+            if match:
+                level = match.group(1).upper()
+                console.print(f"[green]✅ Ollama analysis complete: {level} detail level selected[/green]")
+                return level
             
             console.print(f"[yellow]⚠️  Ollama response unclear, using STANDARD as default: {detail_response}[/yellow]")
             return "STANDARD"  # Default fallback
@@ -141,32 +292,46 @@ Based on your gentle analysis of the content complexity, technical depth, and ed
         
         # Prepare the prompt with detail level
         prompt = self._create_summary_prompt(video_summaries, detail_level)
+        payload = self._generation_payload(prompt, detail_level, model)
         
-        # Adjust max_tokens based on detail level
-        max_tokens_map = {
-            "BRIEF": 800,
-            "STANDARD": 1500,
-            "DETAILED": 2500,
-            "EXTENSIVE": 4000
-        }
+        try:
+            return self._generate(payload, timeout=180) or "Unable to generate summary"
+            
+        except requests.exceptions.RequestException as e:
+            console.print(f"[red]Error communicating with Ollama: {e}[/red]")
+            return "Error: Unable to generate summary due to Ollama connection issues"
+    
+    def refine_summary(self, old_overall: str, new_summaries: List[str], model: str = "deepseek-r1:8b") -> str:
+        """Integrate new video summaries into an existing consolidated summary using Ollama"""
         
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": 0.7,
-                "top_p": 0.9,
-                "max_tokens": max_tokens_map.get(detail_level, 1500)
-            }
-        }
+        # Only the new content is analyzed, so the prompt grows with the batch rather than the corpus
+        detail_level = self.analyze_content_complexity(new_summaries, model)
+        console.print(f"[blue]🎯 Using {detail_level} detail level for summary refinement[/blue]")
+        
+        cap = PER_VIDEO_CAP.get(detail_level, PER_VIDEO_CAP["STANDARD"])
+        new_text = "\n\n".join([
+            f"New Video {i+1} Summary:\n{summary[:cap]}" 
+            for i, summary in enumerate(new_summaries)
+        ])
+        
+        prompt = f"""You are a gentle and helpful content analyst. Here is the current consolidated summary of previously analyzed videos:
+
+{old_overall}
+
+Integrate these {len(new_summaries)} new videos into it:
+
+{new_text}
+
+Detail Level: {detail_level}
+
+IMPORTANT: Keep the existing structure and tone, merge new themes and insights where they fit, and add new sections only for genuinely new topics. Use simple language and keep the summary approachable for learners.
+
+Output the updated consolidated summary."""
+        
+        payload = self._generation_payload(prompt, detail_level, model)
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=180)
-            response.raise_for_status()
-            
-            result = response.json()
-            return result.get("response", "Unable to generate summary")
+            return self._generate(payload, timeout=180) or "Unable to generate summary"
             
         except requests.exceptions.RequestException as e:
             console.print(f"[red]Error communicating with Ollama: {e}[/red]")
@@ -175,10 +340,13 @@ Based on your gentle analysis of the content complexity, technical depth, and ed
     def _create_summary_prompt(self, video_summaries: List[str], detail_level: str = "STANDARD") -> str:
         """Create a prompt for generating consolidated summary with specified detail level"""
         
-        summaries_text = "\n\n".join([
-            f"Video {i+1} Summary:\n{summary}" 
-            for i, summary in enumerate(video_summaries)
-        ])
+        # Bound each video's share of the prompt so its size grows with detail level, not summary length
+        cap = PER_VIDEO_CAP.get(detail_level, PER_VIDEO_CAP["STANDARD"])
+        parts = []
+        append = parts.append
+        for i, summary in enumerate(video_summaries):
+            append(f"Video {i+1} Summary:\n{summary[:cap]}")
+        summaries_text = "\n\n".join(parts)
         
         # Define detail level instructions
         detail_instructions = {
@@ -229,22 +397,109 @@ Provide a unified summary that matches the {detail_level} detail level specified
 
         return prompt
 
+class AsyncOllamaClient(OllamaClient):
+    """Ollama client that summarizes large batches as concurrent chunks using httpx"""
+    
+    def generate_summary(self, video_summaries: List[str], model: str = "deepseek-r1:8b") -> str:
+        """Synchronous entry point; small batches use a single request"""
+        if len(video_summaries) <= CHUNK_THRESHOLD:
+            return super().generate_summary(video_summaries, model)
+        return asyncio.run(self.agenerate_summary(video_summaries, model))
+    
+    async def _agenerate(self, client, payload: Dict[str, Any]) -> str:
+        """Send a generate request asynchronously, using the response cache"""
+        key, cached = self._cache_lookup(payload)
+        if cached is not None:
+            return cached
+        
+        response = await client.post(self.api_url, json=payload)
+        response.raise_for_status()
+        
+        text = response.json().get("response", "")
+        if key is not None and text:
+            self.cache.set(key, payload["model"], text)
+        return text
+    
+    async def agenerate_summary(self, video_summaries: List[str], model: str = "deepseek-r1:8b") -> str:
+        """Summarize chunks of the batch concurrently, then merge the partial summaries"""
+        
+        detail_level = self.analyze_content_complexity(video_summaries, model)
+        console.print(f"[blue]🎯 Using {detail_level} detail level for summary generation[/blue]")
+        
+        chunks = [video_summaries[i:i + CHUNK_SIZE] for i in range(0, len(video_summaries), CHUNK_SIZE)]
+        console.print(f"[blue]🧩 Summarizing {len(video_summaries)} videos in {len(chunks)} concurrent chunks...[/blue]")
+        
+        try:
+            async with httpx.AsyncClient(timeout=180) as client:
+                results = await asyncio.gather(*[
+                    self._agenerate(client, self._generation_payload(
+                        self._create_summary_prompt(chunk, detail_level), detail_level, model))
+                    for chunk in chunks
+                ], return_exceptions=True)
+                
+                partial_summaries = []
+                for result in results:
+                    if isinstance(result, Exception):
+                        console.print(f"[yellow]⚠️  Chunk summary failed: {result}[/yellow]")
+                    elif result:
+                        partial_summaries.append(result)
+                
+                if not partial_summaries:
+                    return "Error: Unable to generate summary due to Ollama connection issues"
+                
+                merge_prompt = self._create_merge_prompt(partial_summaries, len(video_summaries), detail_level)
+                return await self._agenerate(
+                    client, self._generation_payload(merge_prompt, detail_level, model)
+                ) or "Unable to generate summary"
+        
+        except httpx.HTTPError as e:
+            console.print(f"[red]Error communicating with Ollama: {e}[/red]")
+            return "Error: Unable to generate summary due to Ollama connection issues"
+    
+    def _create_merge_prompt(self, partial_summaries: List[str], total_videos: int, detail_level: str) -> str:
+        """Create a prompt that merges partial summaries of chunks into one consolidated summary"""
+        
+        partials_text = "\n\n".join([
+            f"Part {i+1}:\n{summary}" 
+            for i, summary in enumerate(partial_summaries)
+        ])
+        
+        return f"""You are a gentle and helpful content analyst. The following are partial summaries, each covering a group of videos from the same collection:
+
+{partials_text}
+
+Merge them into a single unified {detail_level.lower()} summary covering all {total_videos} videos. Combine overlapping themes, keep the most important insights, and use simple, approachable language.
+
+Detail Level: {detail_level}"""
+
 class ContinuousVideoAgent:
     """Main continuous agent for processing video summaries"""
     
     def __init__(self, monitor_dir: str = "./video_summaries", output_file: str = "overall_summary.json", 
                  ollama_url: str = "http://localhost:11434", model: str = "deepseek-r1:8b", 
-                 check_interval: int = 30):
+                 housekeeping_interval: int = 600):
         self.monitor_dir = Path(monitor_dir)
         self.output_file = Path(output_file)
         self.ollama_url = ollama_url
         self.model = model
-        self.check_interval = check_interval
-        self.ollama_client = OllamaClient(ollama_url)
+        self.housekeeping_interval = housekeeping_interval
+        # Cache responses next to the output file so restarts don't re-run the model
+        cache_path = self.output_file.with_name(f"{self.output_file.stem}_cache.sqlite")
+        client_class = AsyncOllamaClient if httpx is not None else OllamaClient
+        self.ollama_client = client_class(ollama_url, cache_path=str(cache_path))
         self.console = Console()
         self.processed_files: Set[str] = set()
         self.overall_summary: Optional[OverallSummary] = None
+        # Maps "dev:ino:mtime_ns:size" to a content hash so unchanged files are never re-read
+        self._stat_cache: Dict[str, str] = {}
+        # Digests of summaries already fed to Ollama, and the results file each video ID
+        # was summarized from, used to drop duplicates across files
+        self._seen_summaries: Set[bytes] = set()
+        self._seen_video_ids: Dict[str, str] = {}
         self.running = False
+        self._stop_event = threading.Event()
+        # Serializes processing between the watcher and the housekeeping thread
+        self._process_lock = threading.Lock()
         
         # Create monitor directory if it doesn't exist
         self.monitor_dir.mkdir(parents=True, exist_ok=True)
@@ -265,10 +520,16 @@ class ContinuousVideoAgent:
         """Load existing overall summary if available"""
         if self.output_file.exists():
             try:
-                with open(self.output_file, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-                    self.overall_summary = OverallSummary(**data)
+                with open(self.output_file, 'rb') as file:
+                    data = _json_loads(file.read())
+                    if _is_trusted(data):
+                        self.overall_summary = OverallSummary.model_construct(**data)
+                    else:
+                        self.overall_summary = OverallSummary(**data)
                     self.processed_files = set(self.overall_summary.processed_files)
+                    self._stat_cache = dict(self.overall_summary.hash_cache)
+                    self._seen_summaries = {self._summary_digest(summary) for summary in self.overall_summary.video_summaries}
+                    self._seen_video_ids = dict(self.overall_summary.video_sources)
                     console.print(f"[green]Loaded existing summary with {self.overall_summary.total_files} files[/green]")
             except Exception as e:
                 console.print(f"[yellow]Could not load existing summary: {e}[/yellow]")
@@ -276,41 +537,65 @@ class ContinuousVideoAgent:
                 self.processed_files = set()
     
     def _save_summary(self):
-        """Save the overall summary to file"""
+        """Save the overall summary to file atomically"""
         if self.overall_summary:
             try:
-                with open(self.output_file, 'w', encoding='utf-8') as file:
-                    json.dump(self.overall_summary.model_dump(), file, indent=2, ensure_ascii=False)
+                # Write a sibling temp file and rename it over the output so readers never see a partial file
+                tmp_file = self.output_file.with_suffix(self.output_file.suffix + ".tmp")
+                with open(tmp_file, 'wb') as file:
+                    file.write(_json_dumps(self.overall_summary.model_dump()))
+                os.replace(tmp_file, self.output_file)
                 console.print(f"[green]Overall summary saved to: {self.output_file}[/green]")
             except Exception as e:
                 console.print(f"[red]Error saving summary: {e}[/red]")
     
     def _get_file_hash(self, file_path: str) -> str:
-        """Get MD5 hash of file content"""
+        """Get SHA-256 hash of file content, reusing the cached digest while the file is unchanged"""
         try:
+            st = os.stat(file_path)
+            stat_key = f"{st.st_dev}:{st.st_ino}:{st.st_mtime_ns}:{st.st_size}"
+            cached = self._stat_cache.get(stat_key)
+            if cached:
+                return cached
+            
             with open(file_path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
+                if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                    file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+                else:
+                    digest = hashlib.sha256()
+                    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                        digest.update(chunk)
+                    file_hash = digest.hexdigest()
+            
+            self._stat_cache[stat_key] = file_hash
+            return file_hash
         except Exception:
             return ""
     
-    def _is_file_processed(self, file_path: str) -> bool:
+    def _is_file_processed(self, file_path: str, known_hashes: Optional[Set[str]] = None) -> bool:
         """Check if file has been processed before"""
         if file_path in self.processed_files:
             return True
         
         # Check hash to avoid reprocessing same content
         if self.overall_summary and self.overall_summary.file_hashes:
+            if known_hashes is None:
+                known_hashes = set(self.overall_summary.file_hashes.values())
             current_hash = self._get_file_hash(file_path)
-            return current_hash in self.overall_summary.file_hashes.values()
+            return current_hash in known_hashes
         
         return False
     
-    def load_json_file(self, file_path: str) -> List[VideoSummaryf]:
-        """Load and parse JSON file containing video summaries"""
+    def load_json_file(self, file_path: str) -> Optional[List[VideoSummary]]:
+        """Load and parse JSON file containing video summaries
+        
+        Returns None when the file can't be read or parsed. A readable file whose videos
+        were all summarized before yields an empty list.
+        """
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                data = json.load(file)
+            with open(file_path, 'rb') as file:
+                data = _json_loads(file.read())
             
             # Handle different JSON structures
             if isinstance(data, list):
@@ -326,26 +611,35 @@ class ContinuousVideoAgent:
                 # Handle YouTube search results format
                 if "top_3_results" in data:
                     summaries = []
+                    append = summaries.append
+                    seen_video_ids = self._seen_video_ids
                     for video in data["top_3_results"]:
-                        # Extract English summary if available
-                        english_summary = ""
-                        if "multilingual_summaries" in video and "English" in video["multilingual_summaries"]:
-                            english_summary = video["multilingual_summaries"]["English"]
-                        elif "analysis" in video and "summary" in video["analysis"]:
-                            english_summary = video["analysis"]["summary"]
+                        # Skip videos already summarized from another results file; a
+                        # rewritten file keeps its own videos
+                        video_id = video.get("id")
+                        if video_id and seen_video_ids.get(video_id, file_path) != file_path:
+                            continue
+                        
+                        # Extract English summary if available, falling back to the analysis summary
+                        english_summary = ((video.get("multilingual_summaries") or {}).get("English")
+                                           or (video.get("analysis") or {}).get("summary"))
                         
                         if english_summary and english_summary != "Analysis could not be parsed":
-                            summaries.append(VideoSummary(
-                                video_id=video.get("id"),
+                            append(VideoSummary(
+                                video_id=video_id,
                                 title=video.get("title"),
                                 ai_summary=english_summary,
                                 duration=str(video.get("duration_minutes", "")) + " minutes",
                                 metadata={"uploader": video.get("uploader"), "view_count": video.get("view_count")}
                             ))
+                            # Only a usable summary claims the ID, so a failed analysis can be retried
+                            if video_id:
+                                seen_video_ids[video_id] = file_path
                     return summaries
                 
                 # If it's a single object or has a specific structure
                 elif "videos" in data:
+                    # Always validated: the agent never writes these, so they are external input
                     return [VideoSummary(**video) for video in data["videos"]]
                 elif "summaries" in data:
                     return [VideoSummary(ai_summary=summary) for summary in data["summaries"]]
@@ -357,96 +651,151 @@ class ContinuousVideoAgent:
                 
         except FileNotFoundError:
             self.console.print(f"[red]Error: File '{file_path}' not found[/red]")
-            return []
+            return None
         except json.JSONDecodeError as e:
             self.console.print(f"[red]Error: Invalid JSON format in '{file_path}': {e}[/red]")
-            return []
+            return None
         except Exception as e:
             self.console.print(f"[red]Error loading file '{file_path}': {e}[/red]")
-            return []
+            return None
+    
+    @staticmethod
+    def _summary_digest(summary: str) -> bytes:
+        """Get a compact content digest used to detect duplicate summaries"""
+        return hashlib.blake2b(summary.encode("utf-8"), digest_size=16).digest()
     
     def extract_ai_summaries(self, video_summaries: List[VideoSummary]) -> List[str]:
-        """Extract AI summaries from video summary objects"""
+        """Extract AI summaries from video summary objects, skipping exact duplicates"""
         
         summaries = []
+        append = summaries.append
+        seen = self._seen_summaries
+        digest_of = self._summary_digest
         for video in video_summaries:
-            if video.ai_summary:
-                summaries.append(video.ai_summary)
-            elif video.description:
-                summaries.append(video.description)
-            elif video.title:
-                summaries.append(f"Title: {video.title}")
+            summary = video.ai_summary or video.description or (f"Title: {video.title}" if video.title else None)
+            if not summary:
+                continue
+            
+            digest = digest_of(summary)
+            if digest in seen:
+                continue
+            seen.add(digest)
+            append(summary)
         
         return summaries
     
     def process_new_files(self) -> bool:
         """Process new JSON files in the monitor directory"""
         
-        # Check if Ollama is available
-        if not self.ollama_client.is_available():
-            self.console.print("[red]Error: Ollama is not running or not accessible[/red]")
-            return False
-        
-        # Find all JSON files in monitor directory
-        json_files = list(self.monitor_dir.glob("*.json"))
-        
-        # Filter out output file and already processed files
-        new_files = []
-        for file_path in json_files:
-            if (file_path.name != self.output_file.name and 
-                str(file_path) not in self.processed_files and
-                not self._is_file_processed(str(file_path))):
-                new_files.append(file_path)
+        # Find all JSON files in monitor directory with a single directory read
+        output_name = self.output_file.name
+        with os.scandir(self.monitor_dir) as entries:
+            json_files = [entry.path for entry in entries
+                          if entry.name.endswith(".json") and entry.name != output_name
+                          and entry.is_file(follow_symlinks=False)]
         
-        if not new_files:
-            return True  # No new files to process
+        return self._process_paths(json_files)
+    
+    def _process_paths(self, paths: List[str]) -> bool:
+        """Process the given JSON files, skipping any that were already processed"""
+        
+        with self._process_lock:
+            # Filter out already processed files
+            known_hashes = set(self.overall_summary.file_hashes.values()) if self.overall_summary else set()
+            new_files = []
+            for file_path in paths:
+                if (file_path not in self.processed_files and
+                    not self._is_file_processed(file_path, known_hashes)):
+                    new_files.append(file_path)
+            
+            if not new_files:
+                return True  # No new files to process
+            
+            # Check if Ollama is available
+            if not self.ollama_client.is_available():
+                self.console.print("[red]Error: Ollama is not running or not accessible[/red]")
+                return False
+            
+            return self._process_batch(new_files)
+    
+    def _process_batch(self, new_files: List[str]) -> bool:
+        """Summarize a batch of unprocessed files and update the overall summary"""
         
         console.print(f"[blue]Found {len(new_files)} new files to process[/blue]")
         
-        # Collect all video summaries
-        all_video_summaries = []
+        # Collect new video summaries
+        new_video_summaries = []
         processed_file_paths = []
         file_hashes = {}
         
-        # Add existing summaries if available
-        if self.overall_summary:
-            # Reconstruct video summaries from existing data
-            # This is a simplified approach - in practice, you might want to store individual summaries
-            all_video_summaries.extend([f"Previously processed video {i+1}" for i in range(self.overall_summary.total_videos)])
-        
         # Process new files
         for file_path in new_files:
-            console.print(f"[yellow]Processing: {file_path.name}[/yellow]")
+            file_name = os.path.basename(file_path)
+            console.print(f"[yellow]Processing: {file_name}[/yellow]")
             
-            video_summaries = self.load_json_file(str(file_path))
-            if video_summaries:
-                ai_summaries = self.extract_ai_summaries(video_summaries)
-                all_video_summaries.extend(ai_summaries)
-                processed_file_paths.append(str(file_path))
-                file_hashes[str(file_path)] = self._get_file_hash(str(file_path))
-                
-                console.print(f"[green]✓ Added {len(ai_summaries)} summaries from {file_path.name}[/green]")
+            video_summaries = self.load_json_file(file_path)
+            if video_summaries is None:
+                console.print(f"[red]✗ No valid summaries found in {file_name}[/red]")
+                continue
+            
+            # A readable file is recorded even when all its videos were seen before,
+            # so mirrors and re-uploads are not re-read on every pass
+            ai_summaries = self.extract_ai_summaries(video_summaries)
+            new_video_summaries.extend(ai_summaries)
+            processed_file_paths.append(file_path)
+            file_hashes[file_path] = self._get_file_hash(file_path)
+            
+            if ai_summaries:
+                console.print(f"[green]✓ Added {len(ai_summaries)} summaries from {file_name}[/green]")
             else:
-                console.print(f"[red]✗ No valid summaries found in {file_path.name}[/red]")
+                console.print(f"[yellow]- No new summaries in {file_name}, all videos already summarized[/yellow]")
         
-        if not all_video_summaries:
-            console.print("[yellow]No video summaries found in new files[/yellow]")
+        previous_summaries = self.overall_summary.video_summaries if self.overall_summary else []
+        
+        if not new_video_summaries:
+            console.print("[yellow]No new video summaries found in new files[/yellow]")
+            if processed_file_paths:
+                # Persist the skipped files so they aren't reloaded after a restart
+                previous_description = self.overall_summary.overall_ai_description if self.overall_summary else ""
+                self._update_summary(previous_description, previous_summaries, 0, processed_file_paths, file_hashes)
             return True
         
-        # Generate overall summary
-        console.print(f"[blue]Generating overall summary from {len(all_video_summaries)} video summaries...[/blue]")
+        all_video_summaries = previous_summaries + new_video_summaries
+        previous_description = self.overall_summary.overall_ai_description if self.overall_summary else ""
+        if previous_description.startswith("Error:"):
+            # A failed generation can't be refined; rebuild from the stored summaries instead
+            previous_description = ""
         
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=self.console
         ) as progress:
-            task = progress.add_task("Generating overall summary...", total=None)
-            overall_description = self.ollama_client.generate_summary(all_video_summaries, self.model)
+            if previous_description:
+                # Merge only the new videos into the existing summary
+                console.print(f"[blue]Refining overall summary with {len(new_video_summaries)} new video summaries...[/blue]")
+                task = progress.add_task("Refining overall summary...", total=None)
+                overall_description = self.ollama_client.refine_summary(previous_description, new_video_summaries, self.model)
+            else:
+                console.print(f"[blue]Generating overall summary from {len(all_video_summaries)} video summaries...[/blue]")
+                task = progress.add_task("Generating overall summary...", total=None)
+                overall_description = self.ollama_client.generate_summary(all_video_summaries, self.model)
             progress.update(task, description="Summary generation completed")
         
+        total_videos, total_files = self._update_summary(
+            overall_description, all_video_summaries, len(new_video_summaries), processed_file_paths, file_hashes)
+        
+        console.print(f"[green]✓ Successfully processed {len(processed_file_paths)} new files[/green]")
+        console.print(f"[green]✓ Overall summary now covers {total_videos} videos from {total_files} files[/green]")
+        
+        return True
+    
+    def _update_summary(self, overall_description: str, all_video_summaries: List[str], new_video_count: int,
+                        processed_file_paths: List[str], file_hashes: Dict[str, str]) -> Tuple[int, int]:
+        """Record newly processed files in the overall summary and save it, returning the video and file totals"""
+        
         # Update overall summary
-        total_videos = len(all_video_summaries)
+        total_videos = new_video_count + (self.overall_summary.total_videos if self.overall_summary else 0)
         total_files = len(processed_file_paths) + (self.overall_summary.total_files if self.overall_summary else 0)
         
         # Update processed files list
@@ -458,13 +807,21 @@ class ContinuousVideoAgent:
             all_file_hashes.update(self.overall_summary.file_hashes)
         all_file_hashes.update(file_hashes)
         
+        # Only persist stat signatures of files that are part of the summary
+        processed_hashes = set(all_file_hashes.values())
+        
         self.overall_summary = OverallSummary(
             total_videos=total_videos,
             total_files=total_files,
             overall_ai_description=overall_description,
             processed_files=all_processed_files,
             file_hashes=all_file_hashes,
+            hash_cache={key: file_hash for key, file_hash in self._stat_cache.items()
+                        if file_hash in processed_hashes},
+            video_summaries=all_video_summaries,
+            video_sources=dict(self._seen_video_ids),
             summary_metadata={
+                "schema_version": SUMMARY_SCHEMA_VERSION,
                 "model_used": self.model,
                 "last_updated": time.strftime("%Y-%m-%d %H:%M:%S"),
                 "monitor_directory": str(self.monitor_dir)
@@ -477,10 +834,7 @@ class ContinuousVideoAgent:
         # Save updated summary
         self._save_summary()
         
-        console.print(f"[green]✓ Successfully processed {len(processed_file_paths)} new files[/green]")
-        console.print(f"[green]✓ Overall summary now covers {total_videos} videos from {total_files} files[/green]")
-        
-        return True
+        return total_videos, total_files
     
     def display_summary_info(self):
         """Display current summary information"""
@@ -519,27 +873,19 @@ class ContinuousVideoAgent:
         # Start continuous monitoring
         console.print(f"[green]✅ Starting continuous monitoring mode...[/green]")
         console.print(f"[blue]📁 Monitoring directory: {self.monitor_dir}[/blue]")
-        console.print(f"[blue]⏱️  Check interval: {self.check_interval} seconds[/blue]")
+        console.print(f"[blue]⏱️  Housekeeping interval: {self.housekeeping_interval} seconds[/blue]")
         console.print(f"[blue]🤖 Model: {self.model}[/blue]")
         console.print("[yellow]Press Ctrl+C to stop the agent[/yellow]")
         console.print("─" * 60)
         
         self.running = True
+        self._stop_event.clear()
+        
+        housekeeping = threading.Thread(target=self._housekeeping_loop, name="housekeeping", daemon=True)
+        housekeeping.start()
         
         try:
-            while self.running:
-                console.print(f"[blue]🔍 Checking for new files... ({time.strftime('%H:%M:%S')})[/blue]")
-                
-                # Process any new files
-                if self.process_new_files():
-                    console.print(f"[green]✅ Check completed - {time.strftime('%H:%M:%S')}[/green]")
-                else:
-                    console.print(f"[yellow]⚠️  Check completed with issues - {time.strftime('%H:%M:%S')}[/yellow]")
-                
-                # Wait for next check
-                console.print(f"[blue]⏳ Waiting {self.check_interval} seconds until next check...[/blue]")
-                time.sleep(self.check_interval)
-                
+            self._file_watch_loop()
         except KeyboardInterrupt:
             console.print("\n[red]🛑 Continuous monitoring stopped by user[/red]")
         except Exception as e:
@@ -547,9 +893,36 @@ class ContinuousVideoAgent:
         finally:
             self.stop()
     
+    def _file_watch_loop(self):
+        """Block on filesystem events and process changed JSON files as they arrive"""
+        for changes in watch(self.monitor_dir, stop_event=self._stop_event, recursive=False):
+            # Re-root event paths on monitor_dir so keys match the housekeeping scan
+            new_files = [
+                os.path.join(self.monitor_dir, os.path.basename(path)) for change, path in changes
+                if change in (Change.added, Change.modified)
+                and path.endswith(".json")
+                and os.path.basename(path) != self.output_file.name
+            ]
+            if not new_files:
+                continue
+            
+            console.print(f"[blue]🔍 Detected {len(new_files)} changed files ({time.strftime('%H:%M:%S')})[/blue]")
+            if self._process_paths(new_files):
+                console.print(f"[green]✅ Check completed - {time.strftime('%H:%M:%S')}[/green]")
+            else:
+                console.print(f"[yellow]⚠️  Check completed with issues - {time.strftime('%H:%M:%S')}[/yellow]")
+    
+    def _housekeeping_loop(self):
+        """Periodically reconcile the whole directory to catch events the watcher missed"""
+        while not self._stop_event.wait(self.housekeeping_interval):
+            console.print(f"[blue]🧹 Reconciling existing files... ({time.strftime('%H:%M:%S')})[/blue]")
+            if not self.process_new_files():
+                console.print(f"[yellow]⚠️  Reconciliation completed with issues - {time.strftime('%H:%M:%S')}[/yellow]")
+    
     def stop(self):
         """Stop the continuous monitoring agent"""
         self.running = False
+        self._stop_event.set()
         console.print("[green]Final summary:[/green]")
         self.display_summary_info()
         console.print("[green]Agent shutdown complete![/green]")
@@ -561,7 +934,7 @@ def main():
     OUTPUT_FILE = "overall_summary.json"
     OLLAMA_URL = "http://localhost:11434"
     MODEL = "deepseek-r1:8b"
-    CHECK_INTERVAL = 30  # seconds
+    HOUSEKEEPING_INTERVAL = 600  # seconds
     
     # Create and start the agent
     agent = ContinuousVideoAgent(
@@ -569,7 +942,7 @@ def main():
         output_file=OUTPUT_FILE,
         ollama_url=OLLAMA_URL,
         model=MODEL,
-        check_interval=CHECK_INTERVAL
+        housekeeping_interval=HOUSEKEEPING_INTERVAL
     )
     
     # Start the continuous monitoring
@@ -0,0 +1,24 @@
+"""
+Shared fixtures for AI Video Analysis Platform tests.
+"""
+
+import os
+from functools import lru_cache
+
+import pytest
+
+
+@lru_cache(maxsize=None)
+def _dir_names(directory):
+    """Return the entry names of a directory from a single scandir pass."""
+    if not os.path.isdir(directory):
+        return frozenset()
+    with os.scandir(directory) as entries:
+        return frozenset(entry.name for entry in entries)
+
+
+@pytest.fixture(scope="session")
+def repo_files():
+    """List each checked directory once per session so tests probe names without extra stat() calls."""
+    directories = [".", "youtube_analyze", "custom_agent"]
+    return {directory: _dir_names(directory) for directory in directories}
@@ -3,180 +3,209 @@ Basic tests for AI Video Analysis Platform.
 """
 
 import pytest
+import ast
+import collections
 import json
-import tempfile
+import mmap
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
+# Version comparison characters allowed in requirement specifiers
+_OP_CHARS = frozenset("<>=")
 
-class TestProjectStructure:
-    """Test basic project structure and functionality."""
-    
-    def test_project_files_exist(self):
-        """Test that essential project files exist."""
-        required_files = [
-            "README.md",
-            "requirements.txt",
-            "setup.py",
-            "LICENSE",
-            "CHANGELOG.md",
-            "CONTRIBUTING.md",
-            ".gitignore"
-        ]
-        
-        for file_path in required_files:
-            assert Path(file_path).exists(), f"Required file {file_path} not found"
-    
-    def test_youtube_analyze_directory(self):
-        """Test that youtube_analyze directory exists with required files."""
-        youtube_dir = Path("youtube_analyze")
-        assert youtube_dir.exists(), "youtube_analyze directory not found"
-        
-        required_files = [
-            "enhanced_youtube_analyzer.py",
-            "youtube_analyzer_cli.py",
-            "ENHANCED_ANALYZER_README.md"
-        ]
-        
-        for file_path in required_files:
-            assert (youtube_dir / file_path).exists(), f"Required file {file_path} not found in youtube_analyze"
-    
-    def test_custom_agent_directory(self):
-        """Test that custom_agent directory exists with required files."""
-        agent_dir = Path("custom_agent")
-        assert agent_dir.exists(), "custom_agent directory not found"
-        
-        required_files = [
-            "continuous_agent.py",
-            "README.md",
-            "requirements.txt"
-        ]
-        
-        for file_path in required_files:
-            assert (agent_dir / file_path).exists(), f"Required file {file_path} not found in custom_agent"
+# Keywords the README must mention for discoverability
+_README_KEYWORDS = frozenset({
+    "ai",
+    "video analysis",
+    "youtube",
+    "autonomous",
+    "ollama",
+    "python",
+    "open source",
+})
 
+# Either phrase marks installation instructions in the README
+_INSTALL_MARKERS = (b"pip install", b"clone")
 
-class TestConfiguration:
-    """Test configuration and setup."""
-    
-    def test_requirements_format(self):
-        """Test that requirements.txt has valid format."""
-        with open("requirements.txt", "r") as f:
-            requirements = f.readlines()
-        
-        for line in requirements:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                # Basic validation - should contain package name
-                assert ">=" in line or "==" in line or not any(char in line for char in [">", "<", "="]), \
-                    f"Invalid requirement format: {line}"
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _find_keywords(text, keywords):
+    """Return the set of keywords occurring in text, scanning it in a single pass."""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return {keyword for _, keyword in automaton.iter(text)}
     
-    def test_setup_py_valid(self):
-        """Test that setup.py is valid Python."""
-        with open("setup.py", "r") as f:
-            setup_content = f.read()
-        
-        # Basic syntax check
+    # Lookahead so overlapping keywords are all reported
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+    return set(pattern.findall(text))
+
+
+def _contains(path, needle: bytes) -> bool:
+    """Return whether a file contains needle, searching a read-only memory map of it."""
+    with open(path, "rb") as f:
+        # mmap refuses zero-length files
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
         try:
-            compile(setup_content, "setup.py", "exec")
-        except SyntaxError as e:
-            pytest.fail(f"setup.py has syntax error: {e}")
+            return m.find(needle) != -1
+        finally:
+            m.close()
 
 
-class TestDocumentation:
-    """Test documentation quality."""
-    
-    def test_readme_has_keywords(self):
-        """Test that README contains important keywords for discoverability."""
-        with open("README.md", "r", encoding="utf-8") as f:
-            content = f.read().lower()
-        
-        important_keywords = [
-            "ai",
-            "video analysis",
-            "youtube",
-            "autonomous",
-            "ollama",
-            "python",
-            "open source"
-        ]
-        
-        missing_keywords = []
-        for keyword in important_keywords:
-            if keyword not in content:
-                missing_keywords.append(keyword)
-        
-        assert not missing_keywords, f"README missing important keywords: {missing_keywords}"
-    
-    def test_readme_has_installation_instructions(self):
-        """Test that README has installation instructions."""
-        with open("README.md", "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        assert "pip install" in content or "clone" in content, "README should contain installation instructions"
+@lru_cache(maxsize=None)
+def _read_text(path):
+    """Read a text file once; later calls return the cached contents."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=None)
+def _read_bytes(path):
+    """Read a file's raw bytes once, for ASCII checks that need no decoding."""
+    return Path(path).read_bytes()
+
+
+RepoSnapshot = collections.namedtuple("RepoSnapshot", [
+    "readme_lower",
+    "changelog_headers",
+    "requirements",
+    "dir_listings",
+])
+
+
+@pytest.fixture(scope="session")
+def setup_py_ast():
+    """Parse setup.py once per session so tests inspecting it share one AST."""
+    return ast.parse(Path("setup.py").read_bytes(), filename="setup.py")
+
+
+@pytest.fixture(scope="session")
+def repo_snapshot(repo_files):
+    """Load every file the tests inspect once per session."""
+    changelog = _read_bytes("CHANGELOG.md")
+    # Section headers keyed up to the closing bracket, since released versions carry a date
+    changelog_headers = frozenset(
+        line.partition(b"]")[0] + b"]" for line in changelog.splitlines() if line.startswith(b"## [")
+    )
+    lines = (line.strip() for line in _read_text("requirements.txt").splitlines())
     
-    def test_readme_has_usage_examples(self):
-        """Test that README has usage examples."""
-        with open("README.md", "r", encoding="utf-8") as f:
-            content = f.read()
-        
-        assert "```" in content, "README should contain code examples"
+    return RepoSnapshot(
+        readme_lower=_read_text("README.md").lower(),
+        changelog_headers=changelog_headers,
+        requirements=[line for line in lines if line and not line.startswith("#")],
+        dir_listings=repo_files,
+    )
 
 
-class TestJsonProcessing:
-    """Test JSON processing capabilities."""
+@pytest.mark.parametrize("directory, required_files", [
+    (".", [
+        "README.md",
+        "requirements.txt",
+        "setup.py",
+        "LICENSE",
+        "CHANGELOG.md",
+        "CONTRIBUTING.md",
+        ".gitignore"
+    ]),
+    ("youtube_analyze", [
+        "enhanced_youtube_analyzer.py",
+        "youtube_analyzer_cli.py",
+        "ENHANCED_ANALYZER_README.md"
+    ]),
+    ("custom_agent", [
+        "continuous_agent.py",
+        "README.md",
+        "requirements.txt"
+    ]),
+])
+def test_required_files(directory, required_files, repo_snapshot):
+    """Test that each project directory exists with its required files."""
+    listings = repo_snapshot.dir_listings
+    if directory != ".":
+        assert directory in listings["."], f"{directory} directory not found"
     
-    def test_json_validation(self):
-        """Test that JSON files can be processed."""
-        test_data = {
-            "videos": [
-                {
-                    "title": "Test Video",
-                    "duration": 180,
-                    "ai_summary": "This is a test video summary"
-                }
-            ]
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(test_data, f)
-            temp_file = f.name
-        
-        try:
-            with open(temp_file, 'r') as f:
-                loaded_data = json.load(f)
-            
-            assert "videos" in loaded_data
-            assert len(loaded_data["videos"]) == 1
-            assert loaded_data["videos"][0]["title"] == "Test Video"
-        
-        finally:
-            os.unlink(temp_file)
+    missing = set(required_files) - listings[directory]
+    assert not missing, f"Required files {sorted(missing)} not found in {directory}"
+
+
+def test_requirements_format(repo_snapshot):
+    """Test that requirements.txt has valid format."""
+    for line in repo_snapshot.requirements:
+        # Basic validation - should contain package name
+        assert ">=" in line or "==" in line or _OP_CHARS.isdisjoint(line), \
+            f"Invalid requirement format: {line}"
 
 
-class TestProjectMetadata:
-    """Test project metadata and discoverability."""
+def test_setup_py_valid(setup_py_ast):
+    """Test that setup.py is valid Python."""
+    # The fixture fails on a syntax error, so a parsed module is enough here
+    assert isinstance(setup_py_ast, ast.Module)
+
+
+def test_readme_has_keywords(repo_snapshot):
+    """Test that README contains important keywords for discoverability."""
+    matched = _find_keywords(repo_snapshot.readme_lower, _README_KEYWORDS)
     
-    def test_github_actions_exist(self):
-        """Test that GitHub Actions workflow exists."""
-        workflow_path = Path(".github/workflows/ci.yml")
-        assert workflow_path.exists(), "GitHub Actions CI workflow not found"
+    assert _README_KEYWORDS <= matched, f"README missing important keywords: {sorted(_README_KEYWORDS - matched)}"
+
+
+def test_readme_has_installation_instructions():
+    """Test that README has installation instructions."""
+    assert any(_contains("README.md", marker) for marker in _INSTALL_MARKERS), "README should contain installation instructions"
+
+
+def test_readme_has_usage_examples():
+    """Test that README has usage examples."""
+    assert _contains("README.md", b"```"), "README should contain code examples"
+
+
+def test_json_validation(tmp_path):
+    """Test that JSON files can be processed."""
+    test_data = {
+        "videos": [
+            {
+                "title": "Test Video",
+                "duration": 180,
+                "ai_summary": "This is a test video summary"
+            }
+        ]
+    }
     
-    def test_license_is_mit(self):
-        """Test that license is MIT."""
-        with open("LICENSE", "r") as f:
-            license_content = f.read()
-        
-        assert "MIT License" in license_content, "License should be MIT"
+    temp_file = tmp_path / "test.json"
+    temp_file.write_text(json.dumps(test_data))
+    loaded_data = json.loads(temp_file.read_text())
     
-    def test_changelog_format(self):
-        """Test that changelog follows proper format."""
-        with open("CHANGELOG.md", "r") as f:
-            changelog_content = f.read()
-        
-        assert "## [Unreleased]" in changelog_content, "Changelog should have Unreleased section"
-        assert "## [1.0.0]" in changelog_content, "Changelog should have version 1.0.0"
+    assert "videos" in loaded_data
+    assert len(loaded_data["videos"]) == 1
+    assert loaded_data["videos"][0]["title"] == "Test Video"
+
+
+def test_github_actions_exist():
+    """Test that GitHub Actions workflow exists."""
+    workflow_path = Path(".github/workflows/ci.yml")
+    assert workflow_path.exists(), "GitHub Actions CI workflow not found"
+
+
+def test_license_is_mit():
+    """Test that license is MIT."""
+    assert _contains("LICENSE", b"MIT License"), "License should be MIT"
+
+
+def test_changelog_format(repo_snapshot):
+    """Test that changelog follows proper format."""
+    headers = repo_snapshot.changelog_headers
+    assert b"## [Unreleased]" in headers, "Changelog should have Unreleased section"
+    assert b"## [1.0.0]" in headers, "Changelog should have version 1.0.0"
 
 
 if __name__ == "__main__":
-    pytest.main([__file__]) 
\ No newline at end of file
+    pytest.main([__file__])
@@ -0,0 +1,91 @@
+"""
+Tests for the continuous video summary agent.
+"""
+
+import json
+
+import pytest
+
+from custom_agent.continuous_agent import ContinuousVideoAgent
+
+
+def _results_file(path, video_id, summary):
+    """Write a YouTube analyzer results file holding a single video."""
+    path.write_text(json.dumps({"top_3_results": [{
+        "id": video_id,
+        "title": f"Video {video_id}",
+        "duration_minutes": 5,
+        "multilingual_summaries": {"English": summary},
+    }]}))
+
+
+@pytest.fixture
+def make_agent(tmp_path, monkeypatch):
+    """Build agents over a shared monitor directory with a stubbed Ollama client."""
+    monitor_dir = tmp_path / "summaries"
+    output_file = tmp_path / "overall_summary.json"
+
+    def make():
+        agent = ContinuousVideoAgent(monitor_dir=str(monitor_dir), output_file=str(output_file))
+        monkeypatch.setattr(agent.ollama_client, "is_available", lambda: True)
+        monkeypatch.setattr(agent.ollama_client, "generate_summary", lambda summaries, model: "Overall summary")
+        monkeypatch.setattr(agent.ollama_client, "refine_summary", lambda previous, summaries, model: "Refined summary")
+        return agent
+
+    return make
+
+
+def test_duplicate_results_file_processed_once(make_agent, monkeypatch):
+    """Test that a results file whose videos were all seen before is loaded once and remembered."""
+    agent = make_agent()
+    _results_file(agent.monitor_dir / "f1.json", "abc123", "First upload summary")
+    _results_file(agent.monitor_dir / "f2.json", "abc123", "Mirror upload summary")
+
+    loads = []
+    original_load = ContinuousVideoAgent.load_json_file
+
+    def counting_load(self, file_path):
+        loads.append(file_path)
+        return original_load(self, file_path)
+
+    monkeypatch.setattr(ContinuousVideoAgent, "load_json_file", counting_load)
+
+    assert agent.process_new_files()
+    assert agent.process_new_files()
+
+    # A restarted agent must not reload either file
+    restarted = make_agent()
+    assert restarted.process_new_files()
+
+    assert sorted(loads) == sorted(str(agent.monitor_dir / name) for name in ("f1.json", "f2.json"))
+    assert restarted.overall_summary.total_videos == 1
+    assert restarted.overall_summary.video_sources == {"abc123": str(agent.monitor_dir / "f1.json")}
+
+
+def test_duplicate_only_batch_is_persisted(make_agent):
+    """Test that a batch yielding no new summaries still saves its files as processed."""
+    agent = make_agent()
+    first = agent.monitor_dir / "f1.json"
+    _results_file(first, "abc123", "First upload summary")
+    assert agent.process_new_files()
+
+    mirror = agent.monitor_dir / "f2.json"
+    _results_file(mirror, "abc123", "Mirror upload summary")
+    assert agent.process_new_files()
+
+    restarted = make_agent()
+    assert str(mirror) in restarted.processed_files
+    assert str(mirror) in restarted.overall_summary.file_hashes
+    assert restarted.overall_summary.overall_ai_description == "Overall summary"
+    assert restarted.overall_summary.video_sources == {"abc123": str(first)}
+
+
+def test_unreadable_file_is_not_marked_processed(make_agent):
+    """Test that an invalid JSON file is retried rather than recorded as processed."""
+    agent = make_agent()
+    broken = agent.monitor_dir / "broken.json"
+    broken.write_text("{not json")
+
+    assert agent.load_json_file(str(broken)) is None
+    assert agent.process_new_files()
+    assert str(broken) not in agent.processed_files
@@ -0,0 +1,204 @@
+"""
+Tests for the enhanced YouTube analyzer.
+"""
+
+import copy
+import importlib
+import json
+import random
+import sqlite3
+import sys
+import types
+from contextlib import closing, contextmanager
+from pathlib import Path
+
+import pytest
+
+
+def _stub_missing(name, **attrs):
+    """Install a placeholder module when an analyzer dependency isn't installed; no test calls into it."""
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        module = types.ModuleType(name)
+        module.__dict__.update(attrs)
+        sys.modules[name] = module
+
+
+class _Placeholder:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def close(self):
+        pass
+
+
+_stub_missing("openai", OpenAI=_Placeholder)
+_stub_missing("yt_dlp", YoutubeDL=_Placeholder)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "youtube_analyze"))
+
+import enhanced_youtube_analyzer  # noqa: E402
+from enhanced_youtube_analyzer import EnhancedYouTubeAnalyzer  # noqa: E402
+
+
+class _FakeStreamClient:
+    """Stands in for httpx.Client.stream, replaying reply pieces as Ollama NDJSON chunks."""
+
+    def __init__(self, pieces, done=True):
+        self.lines = [json.dumps({"message": {"content": piece}, "done": False}) for piece in pieces]
+        if done:
+            self.lines.append(json.dumps({"message": {"content": ""}, "done": True}))
+        self.consumed = 0
+        self.closed = False
+
+    def _iter_lines(self):
+        for line in self.lines:
+            self.consumed += 1
+            yield line
+
+    @contextmanager
+    def stream(self, method, url, json=None):
+        response = types.SimpleNamespace(raise_for_status=lambda: None, iter_lines=self._iter_lines)
+        try:
+            yield response
+        finally:
+            self.closed = True
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def analyzer(tmp_path):
+    """An analyzer with its prompt cache in a temporary SQLite file."""
+    analyzer = EnhancedYouTubeAnalyzer(cache_file=str(tmp_path / "prompt_cache.sqlite"))
+    yield analyzer
+    analyzer.close()
+
+
+def _stream(analyzer, pieces, done=True):
+    client = _FakeStreamClient(pieces, done)
+    analyzer.http_client = client
+    return client
+
+
+def test_stream_json_ignores_braces_in_strings(analyzer):
+    """Test that braces and escaped quotes inside string values don't end the reply early."""
+    reply = '{"summary": "uses {braces} and [brackets] and \\"quoted }\\" text", "key_benefits": ["a}", "b"]}'
+    # Split mid-escape and mid-string so state carries across chunks
+    pieces = [reply[i:i + 5] for i in range(0, len(reply), 5)]
+    _stream(analyzer, pieces)
+
+    content = analyzer._stream_json({})
+    assert content == reply
+    assert json.loads(content)["key_benefits"] == ["a}", "b"]
+
+
+def test_stream_json_stops_at_closing_brace(analyzer):
+    """Test that trailing tokens after the top-level object are dropped and never read."""
+    client = _stream(analyzer, ['{"summary": ', '"ok"} \n', "\n", "\n", "\n"])
+
+    assert analyzer._stream_json({}) == '{"summary": "ok"}'
+    assert client.consumed == 2
+    assert client.closed
+
+
+def test_truncated_stream_raises_and_is_not_cached(analyzer):
+    """Test that a reply cut off inside its object raises and leaves the prompt cache empty."""
+    _stream(analyzer, ['{"summary": "cut', ' off {'], done=True)
+    messages = [{"role": "system", "content": "system"}, {"role": "user", "content": "user"}]
+
+    with pytest.raises(ValueError):
+        analyzer._chat_messages(messages, max_tokens=10, temperature=0.0, response_format="json")
+
+    assert analyzer._prompt_cache == {}
+    with closing(sqlite3.connect(analyzer.cache_file)) as db:
+        assert db.execute("SELECT COUNT(*) FROM exact").fetchone() == (0,)
+
+
+# Filter implementations: the pure-Python loop, the NumPy path and the numba kernel
+FILTER_PATHS = ["python", "numpy", "numba"]
+
+
+def _filter(analyzer, monkeypatch, path, videos, max_duration_minutes, min_rating_threshold):
+    """Run filter_videos_by_criteria on a copy of videos through the given implementation."""
+    if path == "python":
+        monkeypatch.setattr(enhanced_youtube_analyzer, "np", None)
+    elif enhanced_youtube_analyzer.np is None:
+        pytest.skip("numpy not installed")
+    elif path == "numba":
+        if enhanced_youtube_analyzer._rate_and_filter is None:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(enhanced_youtube_analyzer, "NUMBA_MIN_VIDEOS", 0)
+    elif path == "numpy":
+        monkeypatch.setattr(enhanced_youtube_analyzer, "NUMBA_MIN_VIDEOS", sys.maxsize)
+
+    selected = analyzer.filter_videos_by_criteria(copy.deepcopy(videos), max_duration_minutes, min_rating_threshold)
+    monkeypatch.undo()
+    return [(video["id"], video["duration_minutes"], video["rating"], video["rating_percentage"]) for video in selected]
+
+
+@pytest.mark.parametrize("path", FILTER_PATHS)
+def test_filter_threshold_boundary(analyzer, monkeypatch, path):
+    """Test that videos exactly at the duration and rating limits are kept."""
+    videos = [
+        {"id": "at_limits", "duration": 240, "view_count": 10, "like_count": 7},
+        {"id": "too_long", "duration": 241, "view_count": 10, "like_count": 9},
+        {"id": "below_rating", "duration": 60, "view_count": 1000, "like_count": 699},
+    ]
+
+    assert _filter(analyzer, monkeypatch, path, videos, 4, 0.7) == [("at_limits", 4.0, 0.7, 70.0)]
+
+
+@pytest.mark.parametrize("path", FILTER_PATHS)
+def test_filter_without_like_counts(analyzer, monkeypatch, path):
+    """Test that missing or zero like counts fall back to a popularity rating."""
+    videos = [
+        {"id": "missing", "duration": 60, "view_count": 5000},
+        {"id": "none", "duration": 60, "view_count": 500, "like_count": None},
+        {"id": "zero", "duration": 60, "view_count": 50, "like_count": 0},
+        {"id": "no_views", "duration": 60, "view_count": 0, "like_count": 3},
+        {"id": "no_duration", "duration": None, "like_count": 1},
+    ]
+
+    assert _filter(analyzer, monkeypatch, path, videos, 4, 0.3) == [
+        ("no_duration", 0.0, 1.0, 100.0),
+        ("missing", 1.0, 0.5, 50.0),
+        ("none", 1.0, 0.3, 30.0),
+    ]
+
+
+@pytest.mark.parametrize("path", FILTER_PATHS)
+def test_filter_falls_back_to_top_three(analyzer, monkeypatch, path):
+    """Test that the three best-rated videos are returned, ties in search order, when none qualify."""
+    videos = [
+        {"id": "low", "duration": 600, "view_count": 50},
+        {"id": "tie_first", "duration": 600, "view_count": 5000},
+        {"id": "best", "duration": 600, "view_count": 100, "like_count": 90},
+        {"id": "tie_second", "duration": 600, "view_count": 2000},
+        {"id": "tie_third", "duration": 600, "view_count": 3000},
+    ]
+
+    assert [video[0] for video in _filter(analyzer, monkeypatch, path, videos, 4, 0.95)] == [
+        "best", "tie_first", "tie_second"
+    ]
+
+
+@pytest.mark.parametrize("path", ["numpy", "numba"])
+def test_vectorized_filter_matches_loop(analyzer, monkeypatch, path):
+    """Test that the vectorized filters select, order and rate randomized videos like the Python loop."""
+    rng = random.Random(1234)
+    for trial in range(20):
+        videos = []
+        for index in range(rng.choice([1, 3, 20, 300])):
+            video = {"id": f"{trial}-{index}", "view_count": rng.choice([0, 1, 50, 101, 1000, 1001, rng.randint(0, 10 ** 7)])}
+            if rng.random() < 0.9:
+                video["duration"] = rng.choice([None, 0, 240, 241, rng.randint(0, 3600)])
+            if rng.random() < 0.8:
+                video["like_count"] = rng.choice([None, 0, rng.randint(0, video["view_count"] + 10)])
+            videos.append(video)
+        max_duration_minutes = rng.choice([1, 4, 10, 60])
+        min_rating_threshold = rng.choice([0.0, 0.1, 0.3, 0.5, 0.7, rng.random()])
+
+        expected = _filter(analyzer, monkeypatch, "python", videos, max_duration_minutes, min_rating_threshold)
+        assert _filter(analyzer, monkeypatch, path, videos, max_duration_minutes, min_rating_threshold) == expected
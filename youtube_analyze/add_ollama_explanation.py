@@ -4,56 +4,75 @@ Add Ollama explanation to the notebook
 """
 
 import json
+import os
+import shutil
+import tempfile
+import textwrap
+
+try:
+    import orjson  # Optional: faster notebook parsing
+except ImportError:
+    orjson = None
 
 def add_ollama_explanation():
     """Add explanation about OpenAI import with Ollama"""
     
     # Read the notebook
-    with open('1_foundations/1_lab1_ollama.ipynb', 'r', encoding='utf-8') as f:
-        notebook_data = json.load(f)
+    with open('1_foundations/1_lab1_ollama.ipynb', 'rb') as f:
+        raw = f.read()
+    notebook_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     
     # Create explanation cell
     explanation_cell = {
         "cell_type": "markdown",
         "metadata": {},
-        "source": [
-            "## 🔧 **Important: Why We Still Use `from openai import OpenAI`**\n",
-            "\n",
-            "You might be wondering why we're still importing from `openai` when using Ollama. Here's why:\n",
-            "\n",
-            "### **Ollama Provides OpenAI-Compatible API**\n",
-            "- Ollama runs a local server that **mimics the OpenAI API format**\n",
-            "- This means we can use the **same Python code** with local models\n",
-            "- No need to learn a different library or API format\n",
-            "\n",
-            "### **How It Works**\n",
-            "```python\n",
-            "# Instead of this (OpenAI):\n",
-            "openai = OpenAI()  # Connects to OpenAI servers\n",
-            "\n",
-            "# We use this (Ollama):\n",
-            "openai = OpenAI(\n",
-            "    base_url=\"http://localhost:11434/v1\",  # Local Ollama server\n",
-            "    api_key=\"ollama\"  # Any string works\n",
-            ")\n",
-            "```\n",
-            "\n",
-            "### **Benefits**\n",
-            "- ✅ **Same code** works with both OpenAI and Ollama\n",
-            "- ✅ **No API costs** when using Ollama\n",
-            "- ✅ **Complete privacy** - data stays on your machine\n",
-            "- ✅ **Works offline** - no internet required\n",
-            "\n",
-            "---\n"
-        ]
+        "source": textwrap.dedent("""\
+            ## 🔧 **Important: Why We Still Use `from openai import OpenAI`**
+
+            You might be wondering why we're still importing from `openai` when using Ollama. Here's why:
+
+            ### **Ollama Provides OpenAI-Compatible API**
+            - Ollama runs a local server that **mimics the OpenAI API format**
+            - This means we can use the **same Python code** with local models
+            - No need to learn a different library or API format
+
+            ### **How It Works**
+            ```python
+            # Instead of this (OpenAI):
+            openai = OpenAI()  # Connects to OpenAI servers
+
+            # We use this (Ollama):
+            openai = OpenAI(
+                base_url="http://localhost:11434/v1",  # Local Ollama server
+                api_key="ollama"  # Any string works
+            )
+            ```
+
+            ### **Benefits**
+            - ✅ **Same code** works with both OpenAI and Ollama
+            - ✅ **No API costs** when using Ollama
+            - ✅ **Complete privacy** - data stays on your machine
+            - ✅ **Works offline** - no internet required
+
+            ---
+            """)
     }
     
     # Insert after the title cell (first cell)
     notebook_data['cells'].insert(1, explanation_cell)
     
-    # Write back the notebook
-    with open('1_foundations/1_lab1_ollama.ipynb', 'w', encoding='utf-8') as f:
-        json.dump(notebook_data, f, indent=1, ensure_ascii=False)
+    # Write back the notebook in one write to a sibling temp file, then swap it in
+    payload = json.dumps(notebook_data, indent=1, ensure_ascii=False).encode('utf-8')
+    tmp = tempfile.NamedTemporaryFile(dir='1_foundations', suffix='.ipynb.tmp', delete=False)
+    try:
+        with tmp:
+            tmp.write(payload)
+        # The temp file is created 0600; keep the notebook's own permissions
+        shutil.copymode('1_foundations/1_lab1_ollama.ipynb', tmp.name)
+        os.replace(tmp.name, '1_foundations/1_lab1_ollama.ipynb')
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
     
     print("✅ Ollama explanation added successfully!")
 
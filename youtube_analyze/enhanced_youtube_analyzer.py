@@ -6,141 +6,676 @@ Includes speech-to-text transcription using Ollama
 """
 
 import os
+import sys
 import json
-import requests
+import math
+import shutil
+import hashlib
+import sqlite3
+import httpx
 from openai import OpenAI
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import yt_dlp
-import tempfile
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import h2  # Optional: lets httpx multiplex requests over HTTP/2
+except ImportError:
+    h2 = None
+
+try:
+    import orjson  # Optional: faster JSON parsing and result writing
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np  # Optional: vectorized semantic cache lookups
+except ImportError:
+    np = None
+
+try:
+    import tiktoken  # Optional: token-accurate prompt budgets
+except ImportError:
+    tiktoken = None
+
+try:
+    from numba import njit, prange  # Optional: compiled rating kernel for large candidate sets
+except ImportError:
+    njit = None
+
+try:
+    from faster_whisper import WhisperModel  # Optional: real speech-to-text
+except ImportError:
+    WhisperModel = None
+
+try:
+    from googleapiclient.discovery import build as build_google_api  # Optional: YouTube Data API search
+    import isodate
+except ImportError:
+    build_google_api = None
+    isodate = None
+
+# 4-bit quantized Gemma halves memory traffic per decoded token versus the default tag
+DEFAULT_MODEL = os.getenv("OLLAMA_MODEL", "gemma3:4b-it-q4_K_M")
+
+# Default on-disk location of the chat completion cache (an SQLite database)
+PROMPT_CACHE_FILE = "ollama_prompt_cache.sqlite"
+
+# Cosine similarity above which a cached response is reused for a new prompt
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+# Languages for the multilingual summaries, in output order
+SUMMARY_LANGUAGES = ["English", "Spanish", "French", "Hindi"]
+
+# Non-English summaries, produced together by a single translation call
+TRANSLATION_LANGUAGES = [lang for lang in SUMMARY_LANGUAGES if lang != "English"]
+TRANSLATION_SCHEMA = {
+    "type": "object",
+    "properties": {lang: {"type": "string"} for lang in TRANSLATION_LANGUAGES},
+    "required": TRANSLATION_LANGUAGES
+}
+
+# Token budget per translated language
+TRANSLATION_MAX_TOKENS = 400
+
+# Videos analyzed concurrently in process_json_input
+MAX_ANALYSIS_WORKERS = 3
+
+# Fragments yt-dlp fetches in parallel for a single download
+CONCURRENT_FRAGMENTS = 8
+
+# Largest page the YouTube Data API search endpoint returns
+YOUTUBE_API_MAX_RESULTS = 50
+
+# Audio is decoded to 16 kHz mono signed 16-bit PCM, the format Whisper expects
+AUDIO_SAMPLE_RATE = 16000
+AUDIO_BYTES_PER_SECOND = AUDIO_SAMPLE_RATE * 2
+
+# faster-whisper model size and quantization used for transcription
+WHISPER_MODEL_SIZE = "base"
+WHISPER_COMPUTE_TYPE = "int8"
+
+# Seconds to wait for a single non-streamed chat response
+CHAT_TIMEOUT = 300
+
+# Token budgets for the free-text fields of the video context, so long or
+# non-Latin descriptions and transcripts can't blow up prefill time
+DESCRIPTION_MAX_TOKENS = 256
+TRANSCRIPTION_MAX_TOKENS = 512
+
+# Rough characters per token, used to budget by length when tiktoken is unavailable
+CHARS_PER_TOKEN = 4
+
+# Connections kept open to Ollama, enough for every concurrent summary and analysis call
+OLLAMA_MAX_CONNECTIONS = 16
+
+# Every per-video call opens with the same system message, video context and
+# acknowledgement, so Ollama reuses the prefix's KV cache and only prefills the task
+VIDEO_ANALYST_SYSTEM = (
+    "You are a professional YouTube content analyst, summarizer and translator. "
+    "Follow each instruction about the video below precisely."
+)
+VIDEO_CONTEXT_ACK = "Ready."
+
+# JSON Schema Ollama constrains the analysis reply to, so it always parses
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "content_type": {"type": "string"},
+        "target_audience": {"type": "string"},
+        "quality_score": {"type": "string"},
+        "key_benefits": {"type": "array", "items": {"type": "string"}},
+        "why_highly_rated": {"type": "string"},
+        "recommendation": {"type": "string"},
+        "transcription_summary": {"type": "string"},
+        "content_analysis": {"type": "string"}
+    },
+    "required": [
+        "summary", "content_type", "target_audience", "quality_score", "key_benefits",
+        "why_highly_rated", "recommendation", "transcription_summary", "content_analysis"
+    ]
+}
+
+# Below this many candidates plain NumPy beats the parallel kernel's thread start-up
+NUMBA_MIN_VIDEOS = 256
+
+if njit is not None:
+    # No eager signature: compiling lazily on first call keeps the kernel off the import path,
+    # since most runs never reach NUMBA_MIN_VIDEOS candidates
+    @njit(parallel=True, nogil=True, cache=True)
+    def _rate_and_filter(durations, views, likes, max_duration_minutes, min_rating_threshold):
+        """Rate every video and flag those meeting the duration and rating criteria"""
+        count = durations.shape[0]
+        mask = np.empty(count, dtype=np.bool_)
+        rating = np.empty(count, dtype=np.float64)
+        for i in prange(count):
+            if likes[i] > 0:
+                video_rating = likes[i] / views[i] if views[i] > 0 else 0.0
+            # Without likes data, assume quality from popularity
+            elif views[i] > 1000:
+                video_rating = 0.5
+            elif views[i] > 100:
+                video_rating = 0.3
+            else:
+                video_rating = 0.1
+            rating[i] = video_rating
+            mask[i] = durations[i] / 60 <= max_duration_minutes and video_rating >= min_rating_threshold
+        return mask, rating
+else:
+    _rate_and_filter = None
+
+# Serializes progress output from worker threads so lines never interleave
+_print_lock = threading.Lock()
+
+
+def _log(message: str):
+    """Print a progress line, safe to call from worker threads"""
+    with _print_lock:
+        print(message)
+
 
 class EnhancedYouTubeAnalyzer:
-    def __init__(self, ollama_base_url: str = "http://localhost:11434/v1", model: str = "gemma3:4b"):
-        """Initialize the enhanced YouTube analyzer"""
+    # Whether ffmpeg is on PATH, probed once per process and shared by every instance
+    _ffmpeg_on_path: Optional[bool] = None
+    
+    def __init__(self, ollama_base_url: str = "http://localhost:11434/v1", model: str = DEFAULT_MODEL,
+                 cache_file: Optional[str] = PROMPT_CACHE_FILE, embedding_model: Optional[str] = None,
+                 translation_model: Optional[str] = None):
+        """
+        Initialize the enhanced YouTube analyzer
+        
+        Args:
+            ollama_base_url: Ollama OpenAI-compatible endpoint
+            model: Chat model used for summaries and analysis
+            cache_file: SQLite file persisting cached completions across runs, or None to keep them in memory
+            embedding_model: Ollama embedding model (e.g. nomic-embed-text) enabling the semantic cache
+            translation_model: Smaller model for the translation calls (e.g. llama3.2:3b-instruct-q4_K_M);
+                defaults to OLLAMA_TRANSLATION_MODEL, then to model
+        """
         self.ollama_base_url = ollama_base_url
         self.model = model
+        self.translation_model = translation_model or os.getenv("OLLAMA_TRANSLATION_MODEL") or model
+        self.cache_file = cache_file
+        self.embedding_model = embedding_model
+        
+        # One pooled, thread-safe HTTP client serves every Ollama request; HTTP/2
+        # (when h2 is installed and the endpoint negotiates it) multiplexes them
+        self.http_client = httpx.Client(
+            http2=h2 is not None,
+            limits=httpx.Limits(
+                max_connections=OLLAMA_MAX_CONNECTIONS,
+                max_keepalive_connections=OLLAMA_MAX_CONNECTIONS
+            ),
+            timeout=CHAT_TIMEOUT
+        )
         
         # Initialize OpenAI client for Ollama
         self.client = OpenAI(
             base_url=ollama_base_url,
-            api_key="ollama"
+            api_key="ollama",
+            http_client=self.http_client
         )
         
+        # Chat goes through Ollama's native API, which sits beside the OpenAI shim
+        api_root = ollama_base_url.rstrip('/')
+        if api_root.endswith('/v1'):
+            api_root = api_root[:-len('/v1')]
+        self.ollama_chat_url = f"{api_root}/api/chat"
+        
+        # Exact-match cache: sha256(model, messages) -> response
+        self._prompt_cache: Dict[str, str] = {}
+        # Semantic cache: unit-length prompt embeddings paired with their responses
+        self._semantic_entries: List[Dict[str, Any]] = []
+        # Guards both caches and the cache database when summaries run on worker threads
+        self._cache_lock = threading.Lock()
+        self._cache_db: Optional[sqlite3.Connection] = None
+        self._load_prompt_cache()
+        
+        # Tokenizer for prompt budgets; an approximation of the model's own is close enough
+        self._encoding = None
+        if tiktoken is not None:
+            try:
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:
+                print(f"⚠️  tiktoken encoding unavailable, budgeting prompts by length: {e}")
+        
+        # Whisper model, loaded on first transcription
+        self._whisper_model = None
+        self._whisper_lock = threading.Lock()
+        
+        self.ffmpeg_available = self._probe_ffmpeg()
+        self._deps_checked = False
+        
+        # One search extractor for the analyzer's lifetime, so extractors load once;
+        # the ytsearchN: prefix bounds each query's results
+        self._ydl_search = yt_dlp.YoutubeDL({
+            'quiet': True,
+            'no_warnings': True,
+            'extract_flat': True,
+            'default_search': 'ytsearch'
+        })
+        self._ydl_lock = threading.Lock()
+        
         print(f"✅ Enhanced YouTube Analyzer initialized with model: {model}")
     
-    def check_dependencies(self):
-        """Check if all required dependencies are available"""
-        dependencies = {
-            "yt-dlp": "Video download and metadata extraction"
+    def _load_prompt_cache(self):
+        """Open the cache database and load the completions a previous run stored"""
+        if not self.cache_file:
+            return
+        
+        try:
+            db = sqlite3.connect(self.cache_file, check_same_thread=False)
+        except sqlite3.Error as e:
+            print(f"⚠️  Ignoring unreadable prompt cache {self.cache_file}: {e}")
+            return
+        
+        try:
+            with db:
+                db.execute("CREATE TABLE IF NOT EXISTS exact (key TEXT PRIMARY KEY, response TEXT)")
+                db.execute("CREATE TABLE IF NOT EXISTS semantic (model TEXT, scope TEXT, embedding TEXT, response TEXT)")
+            self._prompt_cache = dict(db.execute("SELECT key, response FROM exact"))
+            self._semantic_entries = [
+                {"model": model, "scope": scope, "embedding": json.loads(embedding), "response": response}
+                for model, scope, embedding, response in db.execute("SELECT model, scope, embedding, response FROM semantic")
+            ]
+        except (sqlite3.Error, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable prompt cache {self.cache_file}: {e}")
+            db.close()
+            return
+        
+        self._cache_db = db
+    
+    def _save_cached_response(self, key: str, response: str, semantic_entry: Optional[Dict[str, Any]] = None):
+        """Persist one new completion; each is an insert, so saving doesn't slow as the cache grows"""
+        if self._cache_db is None:
+            return
+        
+        try:
+            with self._cache_db:
+                self._cache_db.execute("INSERT OR REPLACE INTO exact (key, response) VALUES (?, ?)", (key, response))
+                if semantic_entry is not None:
+                    self._cache_db.execute(
+                        "INSERT INTO semantic (model, scope, embedding, response) VALUES (?, ?, ?, ?)",
+                        (semantic_entry["model"], semantic_entry["scope"],
+                         json.dumps(semantic_entry["embedding"]), semantic_entry["response"])
+                    )
+        except sqlite3.Error as e:
+            _log(f"⚠️  Could not save prompt cache: {e}")
+    
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """Return the unit-length embedding of text, or None if embeddings are unavailable"""
+        try:
+            response = self.client.embeddings.create(model=self.embedding_model, input=text)
+        except Exception as e:
+            _log(f"⚠️  Embedding failed, disabling semantic cache: {e}")
+            self.embedding_model = None
+            return None
+        
+        vector = response.data[0].embedding
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+    
+    def _semantic_lookup(self, model: str, scope: str, embedding: List[float]) -> Optional[str]:
+        """Return the cached response whose prompt embedding is closest to embedding, if similar enough"""
+        candidates = [
+            entry for entry in self._semantic_entries
+            if entry["model"] == model and entry.get("scope") == scope
+            and len(entry["embedding"]) == len(embedding)
+        ]
+        if not candidates:
+            return None
+        
+        if np is not None:
+            matrix = np.asarray([entry["embedding"] for entry in candidates], dtype=np.float32)
+            scores = matrix @ np.asarray(embedding, dtype=np.float32)
+            best = int(scores.argmax())
+            best_score = float(scores[best])
+        else:
+            scores = [sum(a * b for a, b in zip(entry["embedding"], embedding)) for entry in candidates]
+            best = max(range(len(scores)), key=scores.__getitem__)
+            best_score = scores[best]
+        
+        if best_score >= SEMANTIC_CACHE_THRESHOLD:
+            return candidates[best]["response"]
+        return None
+    
+    def _ollama_chat(self, model: str, messages: List[Dict[str, str]], max_tokens: int,
+                     temperature: float, response_format: Optional[Any] = None) -> str:
+        """Send one request to Ollama's native chat endpoint; JSON replies are streamed"""
+        payload = {
+            "model": model,
+            "messages": messages,
+            "stream": response_format is not None,
+            "options": {
+                "num_predict": max_tokens,
+                "temperature": temperature
+            }
         }
+        if response_format is not None:
+            payload["format"] = response_format
+            return self._stream_json(payload)
+        
+        response = self.http_client.post(self.ollama_chat_url, json=payload)
+        response.raise_for_status()
+        return response.json()["message"]["content"]
+    
+    def _stream_json(self, payload: Dict[str, Any]) -> str:
+        """
+        Stream a JSON-constrained reply and hang up as soon as its top-level object closes
+        
+        Constrained decoding can keep emitting whitespace after the closing brace until
+        num_predict runs out; closing the response makes Ollama stop generating.
+        """
+        parts = []
+        depth = 0
+        in_string = escaped = False
+        with self.http_client.stream("POST", self.ollama_chat_url, json=payload) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise RuntimeError(chunk["error"])
+                
+                piece = chunk.get("message", {}).get("content", "")
+                # Track nesting outside string literals, where braces are just text
+                for i, char in enumerate(piece):
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif char == "\\":
+                            escaped = True
+                        elif char == '"':
+                            in_string = False
+                    elif char == '"':
+                        in_string = True
+                    elif char in "{[":
+                        depth += 1
+                    elif char in "}]":
+                        depth -= 1
+                        if depth == 0:
+                            parts.append(piece[:i + 1])
+                            return "".join(parts)
+                parts.append(piece)
+                
+                if chunk.get("done"):
+                    break
+        
+        # The stream ended (num_predict ran out, or the model stopped) inside the object
+        raise ValueError(f"Ollama reply ended before its JSON closed: {''.join(parts)[:80]!r}")
+    
+    def _chat_messages(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float,
+                       model: Optional[str] = None, response_format: Optional[Any] = None) -> str:
+        """
+        Run a chat completion against Ollama, reusing cached responses for repeated conversations
+        
+        Args:
+            messages: Chat messages, starting with the system message
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            model: Model to use instead of the analyzer's default
+            response_format: Ollama output constraint, "json" or a JSON Schema
+            
+        Returns:
+            Response text
+        """
+        model = model or self.model
+        key = hashlib.sha256(
+            (model + "\0" + json.dumps([messages, response_format], ensure_ascii=False)).encode("utf-8")
+        ).hexdigest()
+        cached = self._prompt_cache.get(key)
+        if cached is not None:
+            return cached
         
-        missing = []
+        # Only answers to the same task may stand in for each other: the task is the system
+        # prompt, plus the closing instruction of a video conversation, plus the output format.
+        # The rest of the conversation is the content that is compared semantically.
+        if len(messages) > 2:
+            task, content_messages = [messages[0], messages[-1]], messages[1:-1]
+        else:
+            task, content_messages = messages[:1], messages[1:]
+        scope = hashlib.sha256(
+            json.dumps([[message["content"] for message in task], response_format], ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
         
-        for dep, description in dependencies.items():
+        embedding = None
+        if self.embedding_model:
+            embedding = self._embed("\n\n".join(message["content"] for message in content_messages))
+        if embedding is not None:
+            with self._cache_lock:
+                cached = self._semantic_lookup(model, scope, embedding)
+                if cached is not None:
+                    self._prompt_cache[key] = cached
+                    self._save_cached_response(key, cached)
+                    return cached
+        
+        content = self._ollama_chat(model, messages, max_tokens, temperature, response_format)
+        
+        # A constrained reply that doesn't parse was cut short; replaying it would fail every run
+        if response_format is not None:
             try:
-                if dep == "yt-dlp":
-                    import yt_dlp
-                print(f"✅ {dep}: {description}")
-            except ImportError:
-                missing.append(f"{dep} ({description})")
+                json.loads(content)
+            except ValueError:
+                return content
         
-        # Check ffmpeg separately (optional)
-        try:
-            result = subprocess.run(["ffmpeg", "-version"], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                print("✅ ffmpeg: Audio processing for transcription")
-                self.ffmpeg_available = True
+        with self._cache_lock:
+            self._prompt_cache[key] = content
+            semantic_entry = None
+            if embedding is not None:
+                semantic_entry = {
+                    "model": model,
+                    "scope": scope,
+                    "embedding": embedding,
+                    "response": content
+                }
+                self._semantic_entries.append(semantic_entry)
+            self._save_cached_response(key, content, semantic_entry)
+        
+        return content
+    
+    def _chat(self, system: str, user: str, max_tokens: int, temperature: float,
+              model: Optional[str] = None) -> str:
+        """
+        Run a single-turn chat completion against Ollama
+        
+        Args:
+            system: System message
+            user: User prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            model: Model to use instead of the analyzer's default
+            
+        Returns:
+            Response text
+        """
+        messages = [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user}
+        ]
+        return self._chat_messages(messages, max_tokens, temperature, model)
+    
+    def _truncate(self, text: str, n_tokens: int) -> str:
+        """Cut text down to at most n_tokens tokens"""
+        if self._encoding is None:
+            return text[:n_tokens * CHARS_PER_TOKEN]
+        
+        # Text is untrusted, so special-token markers are encoded as plain text
+        ids = self._encoding.encode(text, disallowed_special=())
+        if len(ids) <= n_tokens:
+            return text
+        return self._encoding.decode(ids[:n_tokens])
+    
+    def _video_context(self, video_info: Dict[str, Any], transcription: str) -> str:
+        """Build the video description block shared by every prompt about the video"""
+        description = self._truncate(video_info.get('description', '') or '', DESCRIPTION_MAX_TOKENS)  # Handle None values
+        transcription = self._truncate(transcription, TRANSCRIPTION_MAX_TOKENS)
+        return f"""
+        Video Title: {video_info.get('title', 'Unknown')}
+        Uploader: {video_info.get('uploader', 'Unknown')}
+        Duration: {video_info.get('duration_minutes', 0)} minutes
+        Views: {video_info.get('view_count', 0):,}
+        Likes: {video_info.get('like_count', 0):,}
+        Rating: {video_info.get('rating_percentage', 0)}%
+        Comments: {video_info.get('comment_count', 0):,}
+        Upload Date: {video_info.get('upload_date', 'Unknown')}
+        Tags: {', '.join(video_info.get('tags', []))}
+        
+        Description: {description}...
+        
+        Transcription: {transcription}
+        """
+    
+    def _chat_about_video(self, context: str, instruction: str, max_tokens: int, temperature: float,
+                          model: Optional[str] = None, response_format: Optional[Any] = None) -> str:
+        """
+        Ask one question about a video, sharing the message prefix with every other call for it
+        
+        Args:
+            context: Video block from _video_context
+            instruction: Task-specific request, the only message that differs between calls
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            model: Model to use instead of the analyzer's default
+            response_format: Ollama output constraint, "json" or a JSON Schema
+            
+        Returns:
+            Response text
+        """
+        messages = [
+            {"role": "system", "content": VIDEO_ANALYST_SYSTEM},
+            {"role": "user", "content": context},
+            {"role": "assistant", "content": VIDEO_CONTEXT_ACK},
+            {"role": "user", "content": instruction}
+        ]
+        return self._chat_messages(messages, max_tokens, temperature, model, response_format)
+    
+    def close(self):
+        """Release the persistent yt-dlp search instance, the pooled HTTP connections and the cache database"""
+        self._ydl_search.close()
+        self.http_client.close()
+        if self._cache_db is not None:
+            self._cache_db.close()
+            self._cache_db = None
+    
+    @classmethod
+    def _probe_ffmpeg(cls) -> bool:
+        """Look ffmpeg up on PATH once; a lookup is enough to know it can run, without spawning it"""
+        if cls._ffmpeg_on_path is None:
+            cls._ffmpeg_on_path = shutil.which("ffmpeg") is not None
+        return cls._ffmpeg_on_path
+    
+    def check_dependencies(self):
+        """
+        Report optional tool availability
+        
+        yt-dlp is imported at module load, so only ffmpeg can be missing, and it is
+        optional; the check always passes and reports once per analyzer.
+        """
+        if not self._deps_checked:
+            if self.ffmpeg_available:
+                _log("✅ ffmpeg: Audio processing for transcription")
             else:
-                print("⚠️  ffmpeg: Not available (transcription will use metadata only)")
-                self.ffmpeg_available = False
-        except FileNotFoundError:
-            print("⚠️  ffmpeg: Not available (transcription will use metadata only)")
-            self.ffmpeg_available = False
-        
-        if missing:
-            print(f"\n❌ Missing dependencies: {', '.join(missing)}")
-            print("\n📦 Install with:")
-            print("pip install yt-dlp")
-            return False
-        
-        print("\n🎉 All dependencies are ready!")
+                _log("⚠️  ffmpeg: Not available (transcription will use metadata only)")
+            self._deps_checked = True
+        
         return True
     
-    def download_audio(self, video_url: str) -> str:
+    def download_audio(self, video_url: str) -> Optional[bytes]:
         """
         Download audio from YouTube video for transcription
         
+        yt-dlp streams the audio into ffmpeg, which decodes it to raw PCM in memory,
+        so nothing is written to disk.
+        
         Args:
             video_url: YouTube video URL
             
         Returns:
-            Path to downloaded audio file
+            16 kHz mono signed 16-bit PCM audio, or None if the download failed
         """
         if not self.ffmpeg_available:
-            print("⚠️  ffmpeg not available, skipping audio download")
+            _log("⚠️  ffmpeg not available, skipping audio download")
             return None
             
         try:
-            # Create temporary directory for audio
-            temp_dir = tempfile.mkdtemp()
-            audio_path = os.path.join(temp_dir, "audio.wav")
-            
-            ydl_opts = {
-                'format': 'bestaudio/best',
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'wav',
-                }],
-                'outtmpl': audio_path.replace('.wav', ''),
-                'quiet': True,
-                'no_warnings': True
-            }
+            downloader = subprocess.Popen(
+                [sys.executable, "-m", "yt_dlp",
+                 "--format", "bestaudio/best",
+                 # A watch URL with &list= must not stream the whole playlist into one buffer
+                 "--no-playlist",
+                 "--concurrent-fragments", str(CONCURRENT_FRAGMENTS),
+                 "--quiet", "--no-warnings",
+                 "--output", "-",
+                 video_url],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            try:
+                decoder = subprocess.Popen(
+                    ["ffmpeg", "-loglevel", "error",
+                     "-i", "pipe:0",
+                     # Drop the picture when only the combined "best" format exists
+                     "-vn",
+                     "-f", "s16le", "-ac", "1", "-ar", str(AUDIO_SAMPLE_RATE),
+                     "pipe:1"],
+                    stdin=downloader.stdout,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL
+                )
+            except OSError:
+                # Nothing will drain yt-dlp's output, so stop it rather than leave it blocked
+                downloader.kill()
+                downloader.wait()
+                raise
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([video_url])
+            # Only ffmpeg holds the pipe now, so yt-dlp sees EPIPE if it exits early
+            downloader.stdout.close()
+            pcm, _ = decoder.communicate()
             
-            # Return the actual audio file path
-            if os.path.exists(audio_path):
-                return audio_path
-            else:
-                # Try to find the actual file
-                for file in os.listdir(temp_dir):
-                    if file.endswith('.wav'):
-                        return os.path.join(temp_dir, file)
+            if downloader.wait() != 0 or decoder.returncode != 0 or not pcm:
+                return None
             
-            return None
+            return pcm
             
         except Exception as e:
-            print(f"❌ Error downloading audio: {e}")
+            _log(f"❌ Error downloading audio: {e}")
             return None
     
-    def transcribe_audio_with_ollama(self, audio_path: str) -> str:
+    def _get_whisper_model(self):
+        """Load the Whisper model once, shared by every transcription"""
+        with self._whisper_lock:
+            if self._whisper_model is None:
+                self._whisper_model = WhisperModel(WHISPER_MODEL_SIZE, compute_type=WHISPER_COMPUTE_TYPE)
+            return self._whisper_model
+    
+    def transcribe_audio_with_ollama(self, audio: Optional[bytes]) -> str:
         """
-        Transcribe audio using Ollama's speech-to-text capabilities
+        Transcribe audio with faster-whisper, or describe it from its length when Whisper is not installed
         
         Args:
-            audio_path: Path to audio file
+            audio: 16 kHz mono signed 16-bit PCM audio from download_audio
             
         Returns:
             Transcribed text or content analysis
         """
         try:
-            # If no audio path provided, return content analysis based on metadata
-            if not audio_path:
+            # If no audio provided, return content analysis based on metadata
+            if not audio:
                 return "Content analysis based on video metadata and description. Audio transcription not available due to missing ffmpeg."
             
-            # Check if audio file exists and has content
-            if not os.path.exists(audio_path):
-                return "Content analysis based on video metadata and description. Audio file not found."
+            if WhisperModel is not None:
+                # Whisper takes float32 samples in [-1, 1]
+                samples = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
+                segments, _ = self._get_whisper_model().transcribe(samples)
+                return " ".join(segment.text.strip() for segment in segments)
             
-            # Get file size to estimate content
-            file_size = os.path.getsize(audio_path)
-            
-            # Create a placeholder transcription based on file size
-            # In a real implementation, you'd use Whisper or another STT service
-            estimated_duration = file_size / 16000  # Rough estimate for WAV files
+            # Without Whisper, fall back to a placeholder based on the audio length
+            estimated_duration = len(audio) / AUDIO_BYTES_PER_SECOND
             
             if estimated_duration < 60:  # Less than 1 minute
                 return "This appears to be a short video. Content analysis based on metadata indicates brief tutorial content."
@@ -150,7 +685,7 @@ class EnhancedYouTubeAnalyzer:
                 return "This is a longer educational video. Content analysis based on metadata suggests comprehensive tutorial material."
                 
         except Exception as e:
-            print(f"❌ Error transcribing audio: {e}")
+            _log(f"❌ Error transcribing audio: {e}")
             return "Content analysis based on video metadata and description. Transcription processing failed."
     
     def translate_content_with_ollama(self, content: str, target_language: str = "English") -> str:
@@ -174,22 +709,62 @@ class EnhancedYouTubeAnalyzer:
             Provide the translation or summary in {target_language}.
             """
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": f"You are a professional translator and content summarizer. Provide accurate translations to {target_language} or clear summaries if content is already in {target_language}."},
-                    {"role": "user", "content": prompt}
-                ],
+            return self._chat(
+                f"You are a professional translator and content summarizer. Provide accurate translations to {target_language} or clear summaries if content is already in {target_language}.",
+                prompt,
                 max_tokens=400,
-                temperature=0.3
+                temperature=0.3,
+                model=self.translation_model
             )
             
-            return response.choices[0].message.content
-            
         except Exception as e:
-            print(f"❌ Error translating content: {e}")
+            _log(f"❌ Error translating content: {e}")
             return f"Translation failed: {content[:100]}..."
     
+    def _summarize_in_english(self, context: str) -> str:
+        """
+        Summarize a video in English
+        
+        Args:
+            context: Video block from _video_context
+            
+        Returns:
+            Summary text
+        """
+        return self._chat_about_video(
+            context,
+            "Create a concise summary of this video content in English. "
+            "Provide a 2-3 sentence summary focusing on the main points and value for viewers.",
+            max_tokens=200,
+            temperature=0.5
+        )
+    
+    def _translate_video(self, context: str) -> Dict[str, Any]:
+        """
+        Translate a video into every non-English summary language with one call
+        
+        Args:
+            context: Video block from _video_context
+            
+        Returns:
+            Parsed reply mapping language names to translations
+        """
+        languages = ", ".join(TRANSLATION_LANGUAGES[:-1]) + f" and {TRANSLATION_LANGUAGES[-1]}"
+        reply = self._chat_about_video(
+            context,
+            f"Translate the video content to {languages}. "
+            "For each language, if the content is already in it, provide a clear summary instead. "
+            "Return a JSON object with one key per language holding its translation or summary.",
+            max_tokens=TRANSLATION_MAX_TOKENS * len(TRANSLATION_LANGUAGES),
+            temperature=0.3,
+            model=self.translation_model,
+            response_format=TRANSLATION_SCHEMA
+        )
+        
+        if orjson is not None:
+            return orjson.loads(reply.encode('utf-8'))
+        return json.loads(reply)
+    
     def generate_multilingual_summary(self, video_info: Dict[str, Any], transcription: str) -> Dict[str, str]:
         """
         Generate multilingual summaries of video content
@@ -201,70 +776,106 @@ class EnhancedYouTubeAnalyzer:
         Returns:
             Dictionary with summaries in different languages
         """
-        # Prepare content for summary
-        description = video_info.get('description', '') or ''  # Handle None values
-        content = f"""
-        Video Title: {video_info.get('title', 'Unknown')}
-        Uploader: {video_info.get('uploader', 'Unknown')}
-        Duration: {video_info.get('duration_minutes', 0)} minutes
-        Views: {video_info.get('view_count', 0):,}
-        Description: {description[:300]}
-        Transcription: {transcription}
-        """
-        
-        # Generate summaries in different languages
+        return self._summarize_video(self._video_context(video_info, transcription))
+    
+    def _summarize_video(self, context: str) -> Dict[str, str]:
+        """Generate the multilingual summaries from an already-built video context"""
+        # The English summary and the batched translations run concurrently; Ollama
+        # serves them in parallel when started with OLLAMA_NUM_PARALLEL>1
         summaries = {}
-        
-        # English summary (original)
-        try:
-            english_prompt = f"""
-            Create a concise summary of this video content in English:
-            
-            {content}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            english = executor.submit(self._summarize_in_english, context)
+            translations = executor.submit(self._translate_video, context)
             
-            Provide a 2-3 sentence summary focusing on the main points and value for viewers.
-            """
+            try:
+                summaries["English"] = english.result()
+            except Exception as e:
+                summaries["English"] = f"Summary generation failed: {str(e)}"
             
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional content summarizer. Create concise, informative summaries."},
-                    {"role": "user", "content": english_prompt}
-                ],
-                max_tokens=200,
-                temperature=0.5
-            )
+            try:
+                translated = translations.result()
+            except Exception as e:
+                _log(f"❌ Error translating content: {e}")
+                translated = {}
+        
+        # Validate each language separately so one bad entry doesn't discard the rest
+        if not isinstance(translated, dict):
+            translated = {}
+        for lang in TRANSLATION_LANGUAGES:
+            text = translated.get(lang)
+            summaries[lang] = text if isinstance(text, str) and text.strip() else f"{lang} translation unavailable"
+        
+        return summaries
+    
+    def search_youtube_videos_api(self, query: str, max_results: int, api_key: str) -> List[Dict[str, Any]]:
+        """
+        Search YouTube with the Data API v3, fetching full metadata in two requests
+        
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
+            api_key: YouTube Data API key
             
-            summaries["English"] = response.choices[0].message.content
-        except Exception as e:
-            summaries["English"] = f"Summary generation failed: {str(e)}"
+        Returns:
+            List of video information dictionaries
+        """
+        youtube = build_google_api('youtube', 'v3', developerKey=api_key, cache_discovery=False)
         
-        # Spanish summary
-        try:
-            spanish_summary = self.translate_content_with_ollama(content, "Spanish")
-            summaries["Spanish"] = spanish_summary
-        except Exception as e:
-            summaries["Spanish"] = "Spanish translation unavailable"
+        search_response = youtube.search().list(
+            q=query,
+            part='id',
+            type='video',
+            maxResults=min(max_results, YOUTUBE_API_MAX_RESULTS)
+        ).execute()
+        ids = [item['id']['videoId'] for item in search_response.get('items', [])]
+        if not ids:
+            return []
         
-        # French summary
-        try:
-            french_summary = self.translate_content_with_ollama(content, "French")
-            summaries["French"] = french_summary
-        except Exception as e:
-            summaries["French"] = "French translation unavailable"
+        videos_response = youtube.videos().list(
+            id=','.join(ids),
+            part='snippet,statistics,contentDetails'
+        ).execute()
+        items = {item['id']: item for item in videos_response.get('items', [])}
         
-        # Hindi summary
-        try:
-            hindi_summary = self.translate_content_with_ollama(content, "Hindi")
-            summaries["Hindi"] = hindi_summary
-        except Exception as e:
-            summaries["Hindi"] = "Hindi translation unavailable"
+        videos = []
+        # Keep the search ranking; videos.list does not guarantee order
+        for video_id in ids:
+            item = items.get(video_id)
+            if item is None:
+                continue
+            
+            snippet = item.get('snippet', {})
+            statistics = item.get('statistics', {})
+            duration = item.get('contentDetails', {}).get('duration')
+            thumbnails = snippet.get('thumbnails', {})
+            thumbnail = (thumbnails.get('high') or thumbnails.get('default') or {}).get('url', '')
+            url = f"https://www.youtube.com/watch?v={video_id}"
+            
+            videos.append({
+                'id': video_id,
+                'title': snippet.get('title', 'Unknown'),
+                'description': snippet.get('description', ''),
+                'duration': int(isodate.parse_duration(duration).total_seconds()) if duration else 0,
+                'uploader': snippet.get('channelTitle', 'Unknown'),
+                'view_count': int(statistics.get('viewCount', 0)),
+                # yt-dlp's YYYYMMDD format
+                'upload_date': snippet.get('publishedAt', '')[:10].replace('-', ''),
+                'tags': snippet.get('tags', []),
+                'categories': [],
+                # Channels can hide likes and disable comments
+                'like_count': int(statistics.get('likeCount', 0)),
+                'comment_count': int(statistics.get('commentCount', 0)),
+                'channel_url': f"https://www.youtube.com/channel/{snippet.get('channelId', '')}",
+                'thumbnail': thumbnail,
+                'url': url,
+                'webpage_url': url
+            })
         
-        return summaries
+        return videos
     
     def search_youtube_videos(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """
-        Search YouTube for videos using yt-dlp
+        Search YouTube for videos, via the Data API when YOUTUBE_API_KEY is set and yt-dlp otherwise
         
         Args:
             query: Search query
@@ -273,48 +884,91 @@ class EnhancedYouTubeAnalyzer:
         Returns:
             List of video information dictionaries
         """
+        api_key = os.getenv('YOUTUBE_API_KEY')
+        if api_key:
+            if build_google_api is None:
+                _log("⚠️  YOUTUBE_API_KEY is set but google-api-python-client/isodate are not installed, using yt-dlp")
+            else:
+                try:
+                    return self.search_youtube_videos_api(query, max_results, api_key)
+                except Exception as e:
+                    _log(f"⚠️  YouTube Data API search failed, using yt-dlp: {e}")
+        
         try:
-            ydl_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': True,
-                'default_search': 'ytsearch',
-                'playlist_items': f'1-{max_results}'
-            }
+            # Search for videos; YoutubeDL instances aren't safe to share across threads
+            with self._ydl_lock:
+                search_results = self._ydl_search.extract_info(f"ytsearch{max_results}:{query}", download=False)
+            
+            videos = []
+            if 'entries' in search_results:
+                for entry in search_results['entries']:
+                    if entry:
+                        video_info = {
+                            'id': entry.get('id', ''),
+                            'title': entry.get('title', 'Unknown'),
+                            'description': entry.get('description', ''),
+                            'duration': entry.get('duration', 0),
+                            'uploader': entry.get('uploader', 'Unknown'),
+                            'view_count': entry.get('view_count', 0),
+                            'upload_date': entry.get('upload_date', ''),
+                            'tags': entry.get('tags', []),
+                            'categories': entry.get('categories', []),
+                            'like_count': entry.get('like_count', 0),
+                            'comment_count': entry.get('comment_count', 0),
+                            'channel_url': entry.get('channel_url', ''),
+                            'thumbnail': entry.get('thumbnail', ''),
+                            'url': entry.get('url', ''),
+                            'webpage_url': entry.get('webpage_url', '')
+                        }
+                        videos.append(video_info)
+            
+            return videos
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # Search for videos
-                search_results = ydl.extract_info(f"ytsearch{max_results}:{query}", download=False)
-                
-                videos = []
-                if 'entries' in search_results:
-                    for entry in search_results['entries']:
-                        if entry:
-                            video_info = {
-                                'id': entry.get('id', ''),
-                                'title': entry.get('title', 'Unknown'),
-                                'description': entry.get('description', ''),
-                                'duration': entry.get('duration', 0),
-                                'uploader': entry.get('uploader', 'Unknown'),
-                                'view_count': entry.get('view_count', 0),
-                                'upload_date': entry.get('upload_date', ''),
-                                'tags': entry.get('tags', []),
-                                'categories': entry.get('categories', []),
-                                'like_count': entry.get('like_count', 0),
-                                'comment_count': entry.get('comment_count', 0),
-                                'channel_url': entry.get('channel_url', ''),
-                                'thumbnail': entry.get('thumbnail', ''),
-                                'url': entry.get('url', ''),
-                                'webpage_url': entry.get('webpage_url', '')
-                            }
-                            videos.append(video_info)
-                
-                return videos
-                
         except Exception as e:
-            print(f"❌ Error searching YouTube: {e}")
+            _log(f"❌ Error searching YouTube: {e}")
             return []
     
+    def _filter_videos_vectorized(self, videos: List[Dict[str, Any]],
+                                  max_duration_minutes: int,
+                                  min_rating_threshold: float) -> List[Dict[str, Any]]:
+        """NumPy implementation of filter_videos_by_criteria, rating every video in one pass"""
+        count = len(videos)
+        # float64 keeps the rounded ratings identical to the pure-Python path
+        durations = np.fromiter((video.get('duration') or 0 for video in videos), dtype=np.float64, count=count)
+        views = np.fromiter((video.get('view_count', 1) or 0 for video in videos), dtype=np.float64, count=count)
+        likes = np.fromiter((video.get('like_count') or 0 for video in videos), dtype=np.float64, count=count)
+        
+        duration_minutes = durations / 60
+        has_likes = likes > 0
+        
+        if _rate_and_filter is not None and count >= NUMBA_MIN_VIDEOS:
+            mask, rating = _rate_and_filter(
+                durations, views, likes, float(max_duration_minutes), float(min_rating_threshold)
+            )
+        else:
+            # Without likes data, assume quality from popularity
+            popularity_rating = np.select([views > 1000, views > 100], [0.5, 0.3], default=0.1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                like_ratio = likes / views
+            rating = np.where(has_likes, np.where(views > 0, like_ratio, 0.0), popularity_rating)
+            mask = (duration_minutes <= max_duration_minutes) & (rating >= min_rating_threshold)
+        
+        # Add calculated fields to every video, so the fallback can rank any of them
+        for video, minutes, video_rating in zip(videos, duration_minutes.tolist(), rating.tolist()):
+            video['duration_minutes'] = round(minutes, 2)
+            video['rating'] = round(video_rating, 4)
+            video['rating_percentage'] = round(video_rating * 100, 2)
+        
+        # Sort by rating (highest first); stable so ties keep search order
+        selected = np.flatnonzero(mask)
+        if selected.size == 0:
+            _log("⚠️  No videos met strict criteria, including top videos anyway...")
+            selected = np.argsort(-rating, kind='stable')[:3]
+        else:
+            selected = selected[np.argsort(-rating[selected], kind='stable')]
+        
+        return [videos[i] for i in selected.tolist()]
+    
     def filter_videos_by_criteria(self, videos: List[Dict[str, Any]], 
                                 max_duration_minutes: int = 4,
                                 min_rating_threshold: float = 0.7) -> List[Dict[str, Any]]:
@@ -329,13 +983,13 @@ class EnhancedYouTubeAnalyzer:
         Returns:
             Filtered list of videos
         """
+        if np is not None and videos:
+            return self._filter_videos_vectorized(videos, max_duration_minutes, min_rating_threshold)
+        
         filtered_videos = []
         
         for video in videos:
-            duration = video.get('duration', 0)
-            if duration is None:
-                duration = 0
-            duration_minutes = duration / 60
+            duration_minutes = (video.get('duration') or 0) / 60
             
             # Calculate rating based on likes vs views ratio
             view_count = video.get('view_count', 1)
@@ -353,108 +1007,89 @@ class EnhancedYouTubeAnalyzer:
             else:
                 rating = like_count / view_count if view_count > 0 else 0
             
+            # Add calculated fields to every video, so the fallback can rank any of them
+            video['duration_minutes'] = round(duration_minutes, 2)
+            video['rating'] = round(rating, 4)
+            video['rating_percentage'] = round(rating * 100, 2)
+            
             # Check if video meets criteria
             if (duration_minutes <= max_duration_minutes and 
                 rating >= min_rating_threshold):
-                
-                # Add calculated fields
-                video['duration_minutes'] = round(duration_minutes, 2)
-                video['rating'] = round(rating, 4)
-                video['rating_percentage'] = round(rating * 100, 2)
-                
                 filtered_videos.append(video)
         
-        # If no videos meet the strict criteria, include some videos anyway
+        # If no videos meet the strict criteria, include the best-rated ones anyway
         if not filtered_videos and videos:
-            print("⚠️  No videos met strict criteria, including top videos anyway...")
-            for video in videos[:3]:  # Take top 3 videos
-                duration = video.get('duration', 0)
-                if duration is None:
-                    duration = 0
-                duration_minutes = duration / 60
-                
-                # Calculate rating with fallback
-                view_count = video.get('view_count', 1)
-                like_count = video.get('like_count', 0)
-                
-                if like_count is None or like_count == 0:
-                    if view_count > 1000:
-                        rating = 0.5
-                    elif view_count > 100:
-                        rating = 0.3
-                    else:
-                        rating = 0.1
-                else:
-                    rating = like_count / view_count if view_count > 0 else 0.1
-                
-                # Add calculated fields
-                video['duration_minutes'] = round(duration_minutes, 2)
-                video['rating'] = round(rating, 4)
-                video['rating_percentage'] = round(rating * 100, 2)
-                
-                filtered_videos.append(video)
+            _log("⚠️  No videos met strict criteria, including top videos anyway...")
+            return sorted(videos, key=lambda x: x['rating'], reverse=True)[:3]
         
         # Sort by rating (highest first)
         filtered_videos.sort(key=lambda x: x['rating'], reverse=True)
         
         return filtered_videos
     
-    def analyze_video_with_ollama(self, video_info: Dict[str, Any], include_transcription: bool = True) -> Dict[str, Any]:
+    def _metadata_analysis(self, video_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Build an analysis from metadata alone, for videos with nothing for the model to read"""
+        return {
+            "summary": f"{video_info.get('title', 'Untitled video')} by {video_info.get('uploader', 'Unknown')}",
+            "content_type": "Unknown",
+            "target_audience": "General",
+            "quality_score": f"{video_info.get('rating_percentage', 0)}% rating",
+            "key_benefits": ["Analysis unavailable"],
+            "why_highly_rated": "Based on like/view ratio",
+            "recommendation": "Consider watching based on ratings",
+            "transcription_summary": "No transcription available",
+            "content_analysis": "No description or transcription available to analyze"
+        }
+    
+    def analyze_video_with_ollama(self, video_info: Dict[str, Any], include_transcription: bool = True,
+                                  audio: Optional[bytes] = None,
+                                  include_translations: bool = False) -> Dict[str, Any]:
         """
         Analyze a single video using Ollama, including transcription if requested
         
         Args:
             video_info: Video information dictionary
             include_transcription: Whether to include speech-to-text transcription
+            audio: Already-downloaded PCM audio for the video; downloaded here when not given
+            include_translations: Whether to generate the multilingual summaries
             
         Returns:
             Analysis results
         """
+        # Without ffmpeg there is no transcription, so a video without a description
+        # gives the model only its title; skip the model calls entirely
+        if not self.ffmpeg_available and not (video_info.get('description') or '').strip():
+            _log(f"⏭️ Nothing to analyze beyond metadata for: {video_info['title'][:50]}")
+            return {
+                **video_info,
+                "analysis": self._metadata_analysis(video_info),
+                "transcription": "",
+                "multilingual_summaries": {}
+            }
+        
         # Get transcription if requested
         transcription = ""
         if include_transcription and video_info.get('webpage_url'):
-            print(f"🎤 Transcribing audio for: {video_info['title'][:50]}...")
-            audio_path = self.download_audio(video_info['webpage_url'])
-            if audio_path:
-                transcription = self.transcribe_audio_with_ollama(audio_path)
-                # Clean up audio file
-                try:
-                    os.remove(audio_path)
-                    os.rmdir(os.path.dirname(audio_path))
-                except:
-                    pass
+            _log(f"🎤 Transcribing audio for: {video_info['title'][:50]}...")
+            if audio is None:
+                audio = self.download_audio(video_info['webpage_url'])
+            if audio:
+                transcription = self.transcribe_audio_with_ollama(audio)
             else:
                 transcription = "Audio transcription not available"
         
-        # Generate multilingual summaries
-        print(f"🌍 Generating multilingual summaries for: {video_info['title'][:50]}...")
-        multilingual_summaries = self.generate_multilingual_summary(video_info, transcription)
-        
-        # Prepare content for analysis
-        description = video_info.get('description', '') or ''  # Handle None values
-        content = f"""
-        Video Title: {video_info.get('title', 'Unknown')}
-        Uploader: {video_info.get('uploader', 'Unknown')}
-        Duration: {video_info.get('duration_minutes', 0)} minutes
-        Views: {video_info.get('view_count', 0):,}
-        Likes: {video_info.get('like_count', 0):,}
-        Rating: {video_info.get('rating_percentage', 0)}%
-        Comments: {video_info.get('comment_count', 0):,}
-        Upload Date: {video_info.get('upload_date', 'Unknown')}
-        Tags: {', '.join(video_info.get('tags', []))}
-        
-        Description: {description[:500]}...
+        # Built once; the summaries and the analysis share it as their prompt prefix
+        context = self._video_context(video_info, transcription)
         
-        Transcription: {transcription}
-        """
+        # Generate multilingual summaries
+        multilingual_summaries = {}
+        if include_translations:
+            _log(f"🌍 Generating multilingual summaries for: {video_info['title'][:50]}...")
+            multilingual_summaries = self._summarize_video(context)
         
-        prompt = f"""
-        Analyze this YouTube video and provide insights in JSON format:
-
-        {content}
-
-        Provide analysis in this exact JSON format:
-        {{
+        instruction = """
+        Analyze this YouTube video and provide detailed, structured insights in this exact JSON format:
+        {
             "summary": "Brief overview of the video content",
             "content_type": "Type of content (educational, entertainment, tutorial, etc.)",
             "target_audience": "Who this video is aimed at",
@@ -464,38 +1099,24 @@ class EnhancedYouTubeAnalyzer:
             "recommendation": "Should viewers watch this video? Why?",
             "transcription_summary": "Summary of transcribed content if available",
             "content_analysis": "Detailed analysis of the video content based on transcription and metadata"
-        }}
+        }
         """
         
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional YouTube content analyst. Provide detailed, structured analysis in JSON format."},
-                    {"role": "user", "content": prompt}
-                ],
+            # The schema constrains decoding, so the reply is valid JSON; a reply cut
+            # off by max_tokens still fails to parse and lands in the handler below
+            analysis_text = self._chat_about_video(
+                context,
+                instruction,
                 max_tokens=600,
-                temperature=0.7
+                temperature=0.7,
+                response_format=ANALYSIS_SCHEMA
             )
             
-            analysis_text = response.choices[0].message.content
-            
-            # Try to parse JSON response
-            try:
+            if orjson is not None:
+                analysis = orjson.loads(analysis_text.encode('utf-8'))
+            else:
                 analysis = json.loads(analysis_text)
-            except json.JSONDecodeError:
-                # If JSON parsing fails, create a basic analysis
-                analysis = {
-                    "summary": "Analysis could not be parsed",
-                    "content_type": "Unknown",
-                    "target_audience": "General",
-                    "quality_score": "N/A",
-                    "key_benefits": ["Content analysis unavailable"],
-                    "why_highly_rated": "Based on like/view ratio",
-                    "recommendation": "Consider watching based on ratings",
-                    "transcription_summary": transcription[:200] if transcription else "No transcription available",
-                    "content_analysis": "Content analysis based on metadata and description"
-                }
             
             # Combine video info with analysis
             return {
@@ -506,7 +1127,7 @@ class EnhancedYouTubeAnalyzer:
             }
             
         except Exception as e:
-            print(f"❌ Error analyzing video: {e}")
+            _log(f"❌ Error analyzing video: {e}")
             return {
                 **video_info,
                 "analysis": {
@@ -534,12 +1155,8 @@ class EnhancedYouTubeAnalyzer:
         Returns:
             Results with top 3 videos and analysis
         """
-        # Check dependencies first
-        if not self.check_dependencies():
-            return {
-                "error": "Missing required dependencies. Please install yt-dlp and ffmpeg.",
-                "timestamp": datetime.now().isoformat()
-            }
+        # Report optional dependencies first
+        self.check_dependencies()
         
         # Extract parameters from JSON input
         query = json_input.get('query', '')
@@ -547,6 +1164,7 @@ class EnhancedYouTubeAnalyzer:
         min_rating = json_input.get('min_rating_threshold', 0.7)
         max_search_results = json_input.get('max_search_results', 20)
         include_transcription = json_input.get('include_transcription', True)
+        include_translations = json_input.get('enable_translations', False)
         
         if not query:
             return {
@@ -554,10 +1172,14 @@ class EnhancedYouTubeAnalyzer:
                 "timestamp": datetime.now().isoformat()
             }
         
-        print(f"🔍 Searching for: {query}")
-        print(f"📏 Max duration: {max_duration} minutes")
-        print(f"⭐ Min rating: {min_rating * 100}%")
-        print(f"🎤 Transcription: {'Enabled' if include_transcription else 'Disabled'}")
+        # One call, so concurrent queries can't split the header
+        _log(
+            f"🔍 Searching for: {query}\n"
+            f"📏 Max duration: {max_duration} minutes\n"
+            f"⭐ Min rating: {min_rating * 100}%\n"
+            f"🎤 Transcription: {'Enabled' if include_transcription else 'Disabled'}\n"
+            f"🌍 Translations: {'Enabled' if include_translations else 'Disabled'}"
+        )
         
         # Search for videos
         videos = self.search_youtube_videos(query, max_search_results)
@@ -569,24 +1191,37 @@ class EnhancedYouTubeAnalyzer:
                 "timestamp": datetime.now().isoformat()
             }
         
-        print(f"📺 Found {len(videos)} videos")
+        _log(f"📺 Found {len(videos)} videos")
         
         # Filter videos by criteria
         filtered_videos = self.filter_videos_by_criteria(
             videos, max_duration, min_rating
         )
         
-        print(f"✅ Filtered to {len(filtered_videos)} videos meeting criteria")
+        _log(f"✅ Filtered to {len(filtered_videos)} videos meeting criteria")
         
         # Get top 3 results
         top_3_videos = filtered_videos[:3]
         
-        # Analyze each video
-        analyzed_videos = []
-        for i, video in enumerate(top_3_videos, 1):
-            print(f"🤖 Analyzing video {i}/3: {video['title'][:50]}...")
-            analyzed_video = self.analyze_video_with_ollama(video, include_transcription)
-            analyzed_videos.append(analyzed_video)
+        # Prefetch all audio up front so the analysis workers never wait on the network
+        prefetched_audio = {}
+        urls = [video['webpage_url'] for video in top_3_videos if video.get('webpage_url')]
+        if include_transcription and self.ffmpeg_available and urls:
+            with ThreadPoolExecutor(max_workers=MAX_ANALYSIS_WORKERS) as executor:
+                prefetched_audio = dict(zip(urls, executor.map(self.download_audio, urls)))
+        
+        # Analyze the videos concurrently; each pipeline is independent.
+        # A failed prefetch leaves no audio, so that video retries the download inline.
+        def analyze(indexed_video):
+            i, video = indexed_video
+            _log(f"🤖 Analyzing video {i}/3: {video['title'][:50]}...")
+            return self.analyze_video_with_ollama(
+                video, include_transcription, prefetched_audio.get(video.get('webpage_url')),
+                include_translations
+            )
+        
+        with ThreadPoolExecutor(max_workers=MAX_ANALYSIS_WORKERS) as executor:
+            analyzed_videos = list(executor.map(analyze, enumerate(top_3_videos, 1)))
         
         # Prepare final results
         results = {
@@ -595,7 +1230,8 @@ class EnhancedYouTubeAnalyzer:
                 "max_duration_minutes": max_duration,
                 "min_rating_threshold": min_rating,
                 "max_search_results": max_search_results,
-                "include_transcription": include_transcription
+                "include_transcription": include_transcription,
+                "enable_translations": include_translations
             },
             "search_stats": {
                 "total_videos_found": len(videos),
@@ -608,13 +1244,14 @@ class EnhancedYouTubeAnalyzer:
         
         return results
     
-    def save_results(self, results: Dict[str, Any], filename: str = None) -> str:
+    def save_results(self, results: Dict[str, Any], filename: str = None, suffix: str = "") -> str:
         """
         Save results to a JSON file
         
         Args:
             results: Results dictionary
             filename: Optional filename, auto-generated if not provided
+            suffix: Appended to an auto-generated filename, to keep concurrent saves apart
             
         Returns:
             Path to saved file
@@ -622,14 +1259,18 @@ class EnhancedYouTubeAnalyzer:
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             query = results.get('query', 'youtube_search').replace(' ', '_')[:20]
-            filename = f"youtube_enhanced_analysis_{query}_{timestamp}.json"
+            filename = f"youtube_enhanced_analysis_{query}_{timestamp}{suffix}.json"
         
         filepath = os.path.join(os.getcwd(), filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2, ensure_ascii=False)
         
-        print(f"💾 Results saved to: {filepath}")
+        _log(f"💾 Results saved to: {filepath}")
         return filepath
 
 
@@ -643,7 +1284,7 @@ def main():
         ollama_base_url = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434/v1')
         test_client = OpenAI(base_url=ollama_base_url, api_key="ollama")
         test_client.chat.completions.create(
-            model="gemma3:4b",
+            model=DEFAULT_MODEL,
             messages=[{"role": "user", "content": "test"}],
             max_tokens=10
         )
@@ -656,13 +1297,14 @@ def main():
     # Initialize analyzer
     analyzer = EnhancedYouTubeAnalyzer()
     
-    # Example JSON input with transcription enabled
+    # Example JSON input with transcription and translations enabled
     example_input = {
         "query": "python tutorial for beginners",
         "max_duration_minutes": 10,
         "min_rating_threshold": 0.5,
         "max_search_results": 5,
-        "include_transcription": True
+        "include_transcription": True,
+        "enable_translations": True
     }
     
     print(f"\n📝 Processing JSON input:")
@@ -670,6 +1312,7 @@ def main():
     
     # Process the input
     results = analyzer.process_json_input(example_input)
+    analyzer.close()
     
     # Display results
     if "error" in results:
@@ -709,7 +1352,8 @@ def main():
         "max_duration_minutes": 10,
         "min_rating_threshold": 0.5,
         "max_search_results": 5,
-        "include_transcription": true
+        "include_transcription": true,
+        "enable_translations": false
     }
     """)
 
@@ -5,18 +5,28 @@ Fix the import comment in the Ollama notebook
 
 import json
 
+try:
+    import orjson  # Optional: faster notebook parsing
+except ImportError:
+    orjson = None
+
 def fix_import_comment():
     """Update the import comment to clarify Ollama usage"""
     
     # Read the notebook
-    with open('1_foundations/1_lab1_ollama.ipynb', 'r', encoding='utf-8') as f:
-        notebook_data = json.load(f)
+    with open('1_foundations/1_lab1_ollama.ipynb', 'rb') as f:
+        raw = f.read()
+    notebook_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     
     # Find and update the import cell
     for cell in notebook_data['cells']:
         if cell['cell_type'] == 'code':
-            source = ''.join(cell['source'])
-            if 'from openai import OpenAI' in source and 'all important import statement' in source:
+            # Source is either one string or a list of lines; scan the lines without joining them
+            lines = cell['source']
+            if isinstance(lines, str):
+                lines = [lines]
+            if (any('from openai import OpenAI' in line for line in lines) and
+                    any('all important import statement' in line for line in lines)):
                 # Update the comments
                 cell['source'] = [
                     "# And now - the all important import statement\n",
@@ -27,9 +37,10 @@ def fix_import_comment():
                 ]
                 break
     
-    # Write back the notebook
-    with open('1_foundations/1_lab1_ollama.ipynb', 'w', encoding='utf-8') as f:
-        json.dump(notebook_data, f, indent=1, ensure_ascii=False)
+    # Write back the notebook, encoded once and written in a single call
+    payload = json.dumps(notebook_data, indent=1, ensure_ascii=False).encode('utf-8')
+    with open('1_foundations/1_lab1_ollama.ipynb', 'wb') as f:
+        f.write(payload)
     
     print("✅ Import comment updated successfully!")
 
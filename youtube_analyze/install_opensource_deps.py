@@ -8,29 +8,56 @@ import subprocess
 import sys
 import platform
 import os
+import shutil
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Model the analyzer uses by default (see enhanced_youtube_analyzer.DEFAULT_MODEL)
+OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "gemma3:4b-it-q4_K_M")
+
+# Import names for PyPI packages whose module is named differently
+IMPORT_NAMES = {
+    "yt-dlp": "yt_dlp",
+    "openai-whisper": "whisper",
+}
+
+# Serializes output from the installer stages, which run in parallel threads
+_print_lock = threading.Lock()
+
+def _log(message):
+    """Print a progress line, safe to call from worker threads"""
+    with _print_lock:
+        print(message)
 
 def run_command(command, description):
-    """Run a command and handle errors"""
-    print(f"📦 {description}...")
+    """Run a command (a shell string or an argument list), streaming its output, and handle errors"""
+    _log(f"📦 {description}...")
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✅ {description} - Success!")
+        # Relay output line by line as it arrives, so long installs and model pulls show
+        # progress and nothing accumulates in memory
+        with subprocess.Popen(command, shell=isinstance(command, str), stdout=subprocess.PIPE,
+                              stderr=subprocess.STDOUT, text=True, bufsize=1) as process:
+            for line in process.stdout:
+                if line.strip():
+                    _log(f"   {line.rstrip()}")
+            returncode = process.wait()
+        
+        if returncode == 0:
+            _log(f"✅ {description} - Success!")
             return True
         else:
-            print(f"❌ {description} - Failed: {result.stderr}")
+            _log(f"❌ {description} - Failed with exit code {returncode}")
             return False
     except Exception as e:
-        print(f"❌ {description} - Error: {e}")
+        _log(f"❌ {description} - Error: {e}")
         return False
 
+@lru_cache(maxsize=None)
 def check_python_package(package_name):
-    """Check if a Python package is installed"""
-    try:
-        __import__(package_name)
-        return True
-    except ImportError:
-        return False
+    """Check if a Python package is installed, without importing it"""
+    return importlib.util.find_spec(package_name) is not None
 
 def install_python_packages():
     """Install required Python packages"""
@@ -42,96 +69,138 @@ def install_python_packages():
         ("torch", "PyTorch for Whisper")
     ]
     
-    print("\n🐍 Installing Python packages...")
-    print("=" * 50)
+    to_install = [package for package, _ in packages if not check_python_package(IMPORT_NAMES.get(package, package))]
+    if not to_install:
+        _log("\n✅ All Python packages already installed")
+        return
+    
+    _log("\n🐍 Installing Python packages...\n" + "=" * 50)
     
     for package, description in packages:
-        if check_python_package(package.replace("-", "_")):
-            print(f"✅ {package} already installed")
+        if package in to_install:
+            _log(f"📦 Will install {package} ({description})")
         else:
-            print(f"📦 Installing {package} ({description})...")
-            success = run_command(f"pip install {package}", f"Installing {package}")
-            if not success:
-                print(f"⚠️ Failed to install {package}, you may need to install it manually")
+            _log(f"✅ {package} already installed")
+    
+    # One pip run resolves and downloads everything together
+    success = run_command(
+        [sys.executable, "-m", "pip", "install", *to_install],
+        f"Installing {', '.join(to_install)}"
+    )
+    if not success:
+        _log(f"⚠️ Failed to install {', '.join(to_install)}, you may need to install them manually")
+
+@lru_cache(maxsize=None)
+def read_os_release():
+    """Return the lowercased contents of /etc/os-release, or None if it can't be read"""
+    try:
+        with open("/etc/os-release", "r") as f:
+            return f.read().lower()
+    except OSError:
+        return None
 
 def install_system_dependencies():
     """Install system dependencies based on OS"""
     system = platform.system().lower()
     
-    print(f"\n🖥️ Installing system dependencies for {system}...")
-    print("=" * 50)
+    # Skip the package managers entirely for tools already on PATH
+    need_ffmpeg = shutil.which("ffmpeg") is None
+    need_ollama = shutil.which("ollama") is None
+    if not need_ffmpeg and not need_ollama:
+        _log("\n✅ FFmpeg and Ollama already installed")
+        return
+    
+    _log(f"\n🖥️ Installing system dependencies for {system}...\n" + "=" * 50)
+    if not need_ffmpeg:
+        _log("✅ FFmpeg already installed")
+    if not need_ollama:
+        _log("✅ Ollama already installed")
     
     if system == "darwin":  # macOS
-        print("🍎 macOS detected")
+        _log("🍎 macOS detected")
         
         # Check if Homebrew is installed
-        if not run_command("which brew", "Checking Homebrew"):
-            print("📦 Installing Homebrew...")
+        if shutil.which("brew") is None:
+            _log("📦 Installing Homebrew...")
             run_command('/bin/bash -c "$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)"', "Installing Homebrew")
         
         # Install FFmpeg
-        run_command("brew install ffmpeg", "Installing FFmpeg")
+        if need_ffmpeg:
+            run_command("brew install ffmpeg", "Installing FFmpeg")
         
         # Install Ollama
-        run_command("brew install ollama", "Installing Ollama")
+        if need_ollama:
+            run_command("brew install ollama", "Installing Ollama")
         
     elif system == "linux":
-        print("🐧 Linux detected")
+        _log("🐧 Linux detected")
         
         # Detect distribution
-        try:
-            with open("/etc/os-release", "r") as f:
-                content = f.read().lower()
-                if "ubuntu" in content or "debian" in content:
-                    run_command("sudo apt update", "Updating package list")
-                    run_command("sudo apt install -y ffmpeg", "Installing FFmpeg")
-                elif "fedora" in content or "rhel" in content or "centos" in content:
-                    run_command("sudo dnf install -y ffmpeg", "Installing FFmpeg")
-                else:
-                    print("⚠️ Unsupported Linux distribution. Please install FFmpeg manually.")
-        except:
-            print("⚠️ Could not detect Linux distribution. Please install FFmpeg manually.")
+        if need_ffmpeg:
+            content = read_os_release()
+            if content is None:
+                _log("⚠️ Could not detect Linux distribution. Please install FFmpeg manually.")
+            elif "ubuntu" in content or "debian" in content:
+                run_command("sudo apt update", "Updating package list")
+                run_command("sudo apt install -y ffmpeg", "Installing FFmpeg")
+            elif "fedora" in content or "rhel" in content or "centos" in content:
+                run_command("sudo dnf install -y ffmpeg", "Installing FFmpeg")
+            else:
+                _log("⚠️ Unsupported Linux distribution. Please install FFmpeg manually.")
         
         # Install Ollama
-        run_command("curl -fsSL https://ollama.ai/install.sh | sh", "Installing Ollama")
+        if need_ollama:
+            run_command("curl -fsSL https://ollama.ai/install.sh | sh", "Installing Ollama")
         
     elif system == "windows":
-        print("🪟 Windows detected")
+        _log("🪟 Windows detected")
         
-        # Check if Chocolatey is installed
-        if not run_command("choco --version", "Checking Chocolatey"):
-            print("📦 Installing Chocolatey...")
-            run_command('powershell -Command "Set-ExecutionPolicy Bypass -Scope Process -Force; [System.Net.ServicePointManager]::SecurityProtocol = [System.Net.ServicePointManager]::SecurityProtocol -bor 3072; iex ((New-Object System.Net.WebClient).DownloadString(\'https://community.chocolatey.org/install.ps1\'))"', "Installing Chocolatey")
-        
-        # Install FFmpeg
-        run_command("choco install ffmpeg -y", "Installing FFmpeg")
+        if need_ffmpeg:
+            # Check if Chocolatey is installed
+            if shutil.which("choco") is None:
+                _log("📦 Installing Chocolatey...")
+                run_command('powershell -Command "Set-ExecutionPolicy Bypass -Scope Process -Force; [System.Net.ServicePointManager]::SecurityProtocol = [System.Net.ServicePointManager]::SecurityProtocol -bor 3072; iex ((New-Object System.Net.WebClient).DownloadString(\'https://community.chocolatey.org/install.ps1\'))"', "Installing Chocolatey")
+            
+            # Install FFmpeg
+            run_command("choco install ffmpeg -y", "Installing FFmpeg")
         
         # Install Ollama (Windows instructions)
-        print("📦 Please install Ollama manually from https://ollama.ai/download")
+        if need_ollama:
+            _log("📦 Please install Ollama manually from https://ollama.ai/download")
         
     else:
-        print(f"⚠️ Unsupported operating system: {system}")
-        print("Please install FFmpeg and Ollama manually")
+        _log(f"⚠️ Unsupported operating system: {system}")
+        _log("Please install FFmpeg and Ollama manually")
 
 def check_ollama_setup():
     """Check if Ollama is properly set up"""
     print("\n🤖 Checking Ollama setup...")
     print("=" * 50)
     
-    # Check if Ollama is running
-    if run_command("ollama list", "Checking Ollama installation"):
+    if shutil.which("ollama") is None:
+        print("❌ Ollama is not installed. Get it from https://ollama.ai/download")
+        return
+    
+    # One listing tells us both that Ollama is running and which models it has
+    print("📦 Checking Ollama installation...")
+    try:
+        result = subprocess.run(["ollama", "list"], capture_output=True, text=True, timeout=5)
+    except subprocess.TimeoutExpired:
+        print("❌ Ollama is not responding. Try restarting it with: ollama serve")
+        return
+    except OSError as e:
+        print(f"❌ Checking Ollama installation - Error: {e}")
+        return
+    
+    if result.returncode == 0:
         print("✅ Ollama is installed and running!")
         
         # Check available models
-        result = subprocess.run("ollama list", shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            if "gemma3:4b" in result.stdout:
-                print("✅ gemma3:4b model is available")
-            else:
-                print("📦 Installing gemma3:4b model...")
-                run_command("ollama pull gemma3:4b", "Installing gemma3:4b")
+        if OLLAMA_MODEL in result.stdout:
+            print(f"✅ {OLLAMA_MODEL} model is available")
         else:
-            print("⚠️ Could not check Ollama models")
+            print(f"📦 Installing {OLLAMA_MODEL} model...")
+            run_command(["ollama", "pull", OLLAMA_MODEL], f"Installing {OLLAMA_MODEL}")
     else:
         print("❌ Ollama is not running. Please start it with: ollama serve")
 
@@ -170,7 +239,7 @@ def test_setup():
     # Test FFmpeg
     import subprocess
     try:
-        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True)
+        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True, timeout=5)
         if result.returncode == 0:
             print("✅ FFmpeg is available")
         else:
@@ -179,10 +248,13 @@ def test_setup():
     except FileNotFoundError:
         print("❌ FFmpeg not found")
         return False
+    except subprocess.TimeoutExpired:
+        print("❌ FFmpeg not responding")
+        return False
     
     # Test Ollama
     try:
-        result = subprocess.run(["ollama", "list"], capture_output=True, text=True)
+        result = subprocess.run(["ollama", "list"], capture_output=True, text=True, timeout=5)
         if result.returncode == 0:
             print("✅ Ollama is working")
         else:
@@ -191,6 +263,9 @@ def test_setup():
     except FileNotFoundError:
         print("❌ Ollama not found")
         return False
+    except subprocess.TimeoutExpired:
+        print("❌ Ollama not responding")
+        return False
     
     print("\\n🎉 All dependencies are working correctly!")
     print("You can now use the open-source YouTube analyzer!")
@@ -220,13 +295,15 @@ def main():
     
     print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor} detected")
     
-    # Install Python packages
-    install_python_packages()
-    
-    # Install system dependencies
-    install_system_dependencies()
+    # Python packages and system packages come from different package managers,
+    # so both downloads run at once
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        python_packages = executor.submit(install_python_packages)
+        system_dependencies = executor.submit(install_system_dependencies)
+        python_packages.result()
+        system_dependencies.result()
     
-    # Check Ollama setup
+    # Check Ollama setup once the system dependencies (which include Ollama) are in
     check_ollama_setup()
     
     # Create test script
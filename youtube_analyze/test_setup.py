@@ -31,7 +31,7 @@ def test_setup():
     # Test FFmpeg
     import subprocess
     try:
-        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True)
+        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True, timeout=5)
         if result.returncode == 0:
             print("✅ FFmpeg is available")
         else:
@@ -40,10 +40,13 @@ def test_setup():
     except FileNotFoundError:
         print("❌ FFmpeg not found")
         return False
+    except subprocess.TimeoutExpired:
+        print("❌ FFmpeg not responding")
+        return False
     
     # Test Ollama
     try:
-        result = subprocess.run(["ollama", "list"], capture_output=True, text=True)
+        result = subprocess.run(["ollama", "list"], capture_output=True, text=True, timeout=5)
         if result.returncode == 0:
             print("✅ Ollama is working")
         else:
@@ -52,6 +55,9 @@ def test_setup():
     except FileNotFoundError:
         print("❌ Ollama not found")
         return False
+    except subprocess.TimeoutExpired:
+        print("❌ Ollama not responding")
+        return False
     
     print("\n🎉 All dependencies are working correctly!")
     print("You can now use the open-source YouTube analyzer!")
@@ -7,8 +7,18 @@ Command-line interface for the enhanced YouTube analyzer
 import json
 import sys
 import argparse
-from pathlib import Path
-from enhanced_youtube_analyzer import EnhancedYouTubeAnalyzer
+import contextlib
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from enhanced_youtube_analyzer import EnhancedYouTubeAnalyzer, DEFAULT_MODEL
+
+try:
+    import orjson  # Optional: faster JSON parsing
+except ImportError:
+    orjson = None
+
+# Queries from a --jobs file analyzed at once; each spends most of its time on the network
+JOBS_MAX_WORKERS = 4
 
 def load_json_input(input_source: str) -> dict:
     """
@@ -20,20 +30,20 @@ def load_json_input(input_source: str) -> dict:
     Returns:
         Parsed JSON dictionary
     """
+    # Open it as a file first; anything that can't be opened is treated as a JSON string
     try:
-        # Check if it's a file path
-        if Path(input_source).exists():
-            with open(input_source, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        else:
-            # Try to parse as JSON string
-            return json.loads(input_source)
-    except json.JSONDecodeError as e:
+        with open(input_source, 'rb') as f:
+            data = f.read()
+    except (OSError, ValueError):
+        data = input_source
+    
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError as e:
         print(f"❌ Error parsing JSON: {e}")
         sys.exit(1)
-    except FileNotFoundError:
-        print(f"❌ File not found: {input_source}")
-        sys.exit(1)
 
 def create_example_json():
     """Create an example JSON input file"""
@@ -70,6 +80,12 @@ Examples:
   
   # Interactive mode
   python youtube_analyzer_cli.py --interactive
+  
+  # Analyze every query in a JSONL file (one JSON object per line)
+  python youtube_analyzer_cli.py --jobs searches.jsonl
+  
+  # Keep the analyzer warm, reading JSON jobs from stdin and writing JSON results to stdout
+  cat searches.jsonl | python youtube_analyzer_cli.py --daemon
         """
     )
     
@@ -91,6 +107,19 @@ Examples:
         help='Run in interactive mode'
     )
     
+    parser.add_argument(
+        '--jobs',
+        type=str,
+        metavar='FILE',
+        help='JSONL file of inputs to analyze concurrently, one JSON object per line'
+    )
+    
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Read JSON inputs from stdin, one per line, and write one JSON result line each to stdout'
+    )
+    
     parser.add_argument(
         '--output', '-o',
         type=str,
@@ -100,8 +129,8 @@ Examples:
     parser.add_argument(
         '--model', '-m',
         type=str,
-        default='gemma3:4b',
-        help='Ollama model to use (default: gemma3:4b)'
+        default=DEFAULT_MODEL,
+        help=f'Ollama model to use (default: {DEFAULT_MODEL})'
     )
     
     args = parser.parse_args()
@@ -116,6 +145,15 @@ Examples:
         run_interactive_mode(args.model, args.output)
         return
     
+    # Handle batch modes
+    if args.daemon:
+        run_daemon_mode(args.model)
+        return
+    
+    if args.jobs:
+        run_jobs_mode(args.model, args.jobs)
+        return
+    
     # Handle input mode
     if not args.input:
         print("❌ Please provide input with --input or use --interactive mode")
@@ -130,6 +168,7 @@ Examples:
     
     # Process the input
     results = analyzer.process_json_input(json_input)
+    analyzer.close()
     
     # Handle errors
     if "error" in results:
@@ -216,34 +255,127 @@ def run_interactive_mode(model: str, output_file: str = None):
         if continue_search not in ['y', 'yes']:
             break
     
+    analyzer.close()
     print("\n👋 Thanks for using the YouTube Analyzer!")
 
+def run_jobs_mode(model: str, jobs_file: str):
+    """Analyze every JSON input in a JSONL file, several queries at a time"""
+    try:
+        with open(jobs_file, 'r', encoding='utf-8') as f:
+            jobs = [json.loads(line) for line in f if line.strip()]
+    except OSError as e:
+        print(f"❌ Could not read jobs file: {e}")
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        print(f"❌ Error parsing JSON: {e}")
+        sys.exit(1)
+    
+    print(f"📋 Loaded {len(jobs)} jobs from {jobs_file}")
+    
+    # One analyzer serves every job, so the client, caches and models load once
+    analyzer = EnhancedYouTubeAnalyzer(model=model)
+    
+    def run(job):
+        # An exception would surface from the pool and abort every remaining job
+        if not isinstance(job, dict):
+            return {"error": "JSON input must be an object"}
+        try:
+            return analyzer.process_json_input(job)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    try:
+        # Searches, downloads and transcriptions of different queries overlap; the analyzer
+        # logs progress one whole line at a time, so concurrent jobs never split a line
+        with ThreadPoolExecutor(max_workers=JOBS_MAX_WORKERS) as executor:
+            for i, results in enumerate(executor.map(run, jobs), 1):
+                if "error" in results:
+                    print(f"❌ Job {i}: {results['error']}")
+                    continue
+                
+                display_results(results)
+                # The job number keeps same-query saves in the same second from overwriting each other
+                filename = analyzer.save_results(results, suffix=f"_job{i}")
+                print(f"\n💾 Full results saved to: {filename}")
+    finally:
+        analyzer.close()
+
+def run_daemon_mode(model: str):
+    """Keep one analyzer warm, answering each JSON input line on stdin with a JSON result line"""
+    results_out = sys.stdout
+    
+    # Progress messages go to stderr so stdout carries nothing but results
+    with contextlib.redirect_stdout(sys.stderr):
+        analyzer = EnhancedYouTubeAnalyzer(model=model)
+        
+        try:
+            for line in sys.stdin:
+                if not line.strip():
+                    continue
+                
+                try:
+                    json_input = json.loads(line)
+                except json.JSONDecodeError as e:
+                    results = {"error": f"Error parsing JSON: {e}"}
+                else:
+                    if not isinstance(json_input, dict):
+                        results = {"error": "JSON input must be an object"}
+                    else:
+                        # A bad field value must fail only its own job, not the daemon
+                        try:
+                            results = analyzer.process_json_input(json_input)
+                        except Exception as e:
+                            results = {"error": str(e)}
+                
+                results_out.write(json.dumps(results, ensure_ascii=False) + "\n")
+                results_out.flush()
+        finally:
+            analyzer.close()
+
+def _shorten(text: str, width: int) -> str:
+    """Shorten text at a word boundary, or by characters when it has no usable spaces (e.g. CJK)"""
+    shortened = textwrap.shorten(text, width, placeholder='...')
+    if shortened == '...':
+        return text[:width - 3] + '...'
+    return shortened
+
 def display_results(results: dict):
     """Display analysis results in a formatted way"""
-    print(f"\n🎉 Analysis Complete!")
-    print(f"📊 Found {results['search_stats']['videos_meeting_criteria']} videos meeting criteria")
-    print(f"🏆 Top 3 Results:")
+    # Render everything first and write it once, so the block stays together on screen
+    parts = [
+        f"\n🎉 Analysis Complete!\n"
+        f"📊 Found {results['search_stats']['videos_meeting_criteria']} videos meeting criteria\n"
+        f"🏆 Top 3 Results:\n"
+    ]
     
     for i, video in enumerate(results['top_3_results'], 1):
-        print(f"\n{i}. {video['title']}")
-        print(f"   👤 {video['uploader']}")
-        print(f"   ⏱️  {video['duration_minutes']} minutes")
-        print(f"   👀 {video['view_count']:,} views")
-        print(f"   ⭐ {video['rating_percentage']}% rating")
-        print(f"   📝 {video['analysis']['summary']}")
-        print(f"   🎯 {video['analysis']['content_type']}")
-        print(f"   💡 {video['analysis']['recommendation']}")
-        print(f"   🔗 {video.get('webpage_url', 'URL not available')}")
+        analysis = video['analysis']
+        parts.append(
+            f"\n{i}. {video['title']}\n"
+            f"   👤 {video['uploader']}\n"
+            f"   ⏱️  {video['duration_minutes']} minutes\n"
+            f"   👀 {video['view_count']:,} views\n"
+            f"   ⭐ {video['rating_percentage']}% rating\n"
+            f"   📝 {analysis['summary']}\n"
+            f"   🎯 {analysis['content_type']}\n"
+            f"   💡 {analysis['recommendation']}\n"
+            f"   🔗 {video.get('webpage_url', 'URL not available')}\n"
+        )
         
         # Display transcription if available
         if video.get('transcription'):
-            print(f"   🎤 Transcription: {video['transcription'][:100]}...")
+            parts.append(f"   🎤 Transcription: {_shorten(video['transcription'], 100)}\n")
         
         # Display multilingual summaries
         if video.get('multilingual_summaries'):
-            print(f"   🌍 Multilingual Summaries:")
-            for lang, summary in video['multilingual_summaries'].items():
-                print(f"      {lang}: {summary[:150]}...")
+            parts.append("   🌍 Multilingual Summaries:\n")
+            parts.extend(
+                f"      {lang}: {_shorten(summary, 150)}\n"
+                for lang, summary in video['multilingual_summaries'].items()
+            )
+    
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file